@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """Script to verify all approved repositories."""
+import asyncio
 import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import click
+from async_github_client import prefetch_repositories
+from config import REPORT_CACHE_PATH, REPORT_CACHE_MAX_AGE_DAYS
 from github_client import GitHubClient
+from report_cache import ReportCache
+from utils import parse_github_url
 from verifier import RepositoryVerifier
 from rich.console import Console
 from rich.table import Table
 
-load_dotenv()
-
 # Default list of approved repositories
 DEFAULT_REPOS = [
     "https://github.com/reliableengineer0308/markitdown",
@@ -70,7 +75,7 @@ DEFAULT_REPOS = [
 ]
 
 # Load from environment variable if available
-# Set APPROVED_REPOS in .env as comma-separated URLs
+# Set APPROVED_REPOS in .env as comma-separated URLs (.env is loaded by config)
 env_repos = os.getenv('APPROVED_REPOS', '').strip()
 if env_repos:
     APPROVED_REPOS = [repo.strip() for repo in env_repos.split(',') if repo.strip()]
@@ -78,33 +83,117 @@ else:
     APPROVED_REPOS = DEFAULT_REPOS
 
 
-def verify_all():
+# Number of repositories verified concurrently
+DEFAULT_WORKERS = 8
+
+def _display_name(repo_url: str) -> str:
+    """Short repository name for progress output."""
+    parsed = parse_github_url(repo_url)
+    return parsed[1] if parsed else repo_url
+
+
+def verify_all(workers: int = DEFAULT_WORKERS):
     """Verify all approved repositories."""
+    # Fail fast on a missing token instead of once per repository
     client = GitHubClient()
+    total = len(APPROVED_REPOS)
+    
+    print(f"Verifying {total} approved repositories with {workers} workers...\n")
+    
+    # Results are stored by position so the summary keeps the original order
+    results = [None] * total
+    
+    # A malformed entry is reported like any other failure instead of
+    # aborting the run
+    full_names = [None] * total
+    for i, url in enumerate(APPROVED_REPOS):
+        try:
+            full_names[i] = client.parse_full_name(url)
+        except ValueError as e:
+            results[i] = (_display_name(url), None, e)
+            print(f"{_display_name(url)}... ❌ ERROR: {e}")
+    
+    # Prefetch metadata (including each default branch SHA) for the whole
+    # list with batched GraphQL queries
+    infos = client.get_repos_bulk([name for name in full_names if name is not None])
+    
+    # Reuse reports for repositories whose default branch hasn't moved
+    report_cache = None
+    head_shas = [None] * total
+    if REPORT_CACHE_PATH:
+        report_cache = ReportCache(REPORT_CACHE_PATH, max_age_seconds=REPORT_CACHE_MAX_AGE_DAYS * 86400)
+        for i, full_name in enumerate(full_names):
+            info = infos.get(full_name) if full_name is not None else None
+            if info is None:
+                continue
+            head_shas[i] = client.prefetched.get(info.full_name, {}).get("head_sha")
+            if head_shas[i]:
+                report = report_cache.get(info.full_name, head_shas[i])
+                if report is not None:
+                    results[i] = (_display_name(APPROVED_REPOS[i]), report, None)
+    
+    pending = [i for i in range(total) if results[i] is None]
+    if len(pending) < total:
+        print(f"Reusing {total - len(pending)} cached report(s) for unchanged repositories\n")
+    
+    # Then fetch trees (at the SHAs the GraphQL query returned) and contributor
+    # counts concurrently on one event loop; the (read-only) result is shared
+    # by all worker clients
+    pending_names = [full_names[i] for i in pending]
+    refs = {}
+    for i in pending:
+        info = infos.get(full_names[i])
+        head_sha = client.prefetched.get(info.full_name, {}).get("head_sha") if info else None
+        if head_sha:
+            refs[info.full_name] = head_sha
+    for full_name, data in asyncio.run(prefetch_repositories(refs, client.token)).items():
+        client.prefetched.setdefault(full_name, {}).update(data)
+    
+    # Hydrate Repository objects with a few search requests instead of one
+    # GET per repository; anything the search misses is fetched by URL
+    repos = client.bulk_fetch(pending_names)
+    
+    # Workers share one client and verifier: the requester keeps each thread's
+    # request apart on the pooled connection
     verifier = RepositoryVerifier(client)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(verifier.verify_repository, repos.get(full_names[i], APPROVED_REPOS[i])): i
+            for i in pending
+        }
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            name = _display_name(APPROVED_REPOS[i])
+            
+            try:
+                report = future.result()
+                results[i] = (name, report, None)
+                if report.passed:
+                    print(f"[{done}/{len(pending)}] {name}... ✅ {report.score:.0f}")
+                else:
+                    print(f"[{done}/{len(pending)}] {name}... ❌ {report.score:.0f} ({len(report.get_failed_checks())} issues)")
+                if report_cache is not None and head_shas[i]:
+                    report_cache.set(report.repository.full_name, head_shas[i], report)
+            except Exception as e:
+                results[i] = (name, None, e)
+                print(f"[{done}/{len(pending)}] {name}... ❌ ERROR: {e}")
     
-    print(f"Verifying {len(APPROVED_REPOS)} approved repositories...\n")
+    if report_cache is not None:
+        report_cache.close()
     
     passed = []
     failed = []
     
-    for i, repo_url in enumerate(APPROVED_REPOS, 1):
-        name = repo_url.rstrip('/').split('/')[-1]
-        print(f"[{i}/{len(APPROVED_REPOS)}] {name}...", end=" ")
-        
-        try:
-            report = verifier.verify_repository(repo_url)
-            if report.passed:
-                passed.append((name, report.score))
-                print(f"✅ {report.score:.0f}")
-            else:
-                failed.append((name, report.score, len(report.get_failed_checks())))
-                print(f"❌ {report.score:.0f} ({len(report.get_failed_checks())} issues)")
-        except Exception as e:
-            failed.append((name, 0, str(e)))
-            print(f"❌ ERROR: {e}")
+    for name, report, error in results:
+        if error is not None:
+            failed.append((name, 0, str(error)))
+        elif report.passed:
+            passed.append((name, report.score))
+        else:
+            failed.append((name, report.score, len(report.get_failed_checks())))
     
-    print(f"\n✅ Passed: {len(passed)}/{len(APPROVED_REPOS)}")
+    print(f"\n✅ Passed: {len(passed)}/{total}")
     if failed:
         print(f"❌ Failed: {len(failed)}")
         print("\nFailed repos:")
@@ -112,5 +201,13 @@ def verify_all():
             print(f"  - {item[0]}: score {item[1]}")
 
 
+@click.command()
+@click.option('--workers', '-w', default=DEFAULT_WORKERS, show_default=True,
+              type=click.IntRange(min=1), help='Number of repositories verified in parallel')
+def main(workers):
+    """Verify all approved repositories."""
+    verify_all(workers=workers)
+
+
 if __name__ == '__main__':
-    verify_all()
+    main()
@@ -0,0 +1,132 @@
+"""Async GitHub API client for concurrent bulk prefetching."""
+import asyncio
+import re
+from typing import Any, Optional
+
+import httpx
+
+from config import GITHUB_TOKEN
+from rate_limiter import RateLimiter
+
+# Concurrent in-flight requests per client
+MAX_CONCURRENCY = 32
+# Retries for secondary rate limit responses
+MAX_RETRIES = 3
+# Wait used when GitHub does not send Retry-After (per GitHub's guidance)
+DEFAULT_RETRY_AFTER = 60
+
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+class AsyncGitHubClient:
+    """Async wrapper for the GitHub REST calls used during verification."""
+
+    def __init__(self, token: Optional[str] = None, max_concurrency: int = MAX_CONCURRENCY):
+        """Initialize async client with token."""
+        self.token = token or GITHUB_TOKEN
+        if not self.token:
+            raise ValueError("GitHub token is required. Set GITHUB_TOKEN in .env file")
+        self._client = httpx.AsyncClient(
+            base_url="https://api.github.com",
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github+json",
+            },
+            http2=True,
+            limits=httpx.Limits(max_connections=max_concurrency),
+            timeout=30,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Same per-token budget as the synchronous clients
+        self.rate_limiter = RateLimiter.shared(self.token)
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def _get(self, url: str, params: Optional[dict[str, Any]] = None) -> httpx.Response:
+        """GET a URL, waiting out secondary rate limits."""
+        for attempt in range(MAX_RETRIES + 1):
+            if self.rate_limiter.exhausted():
+                await asyncio.to_thread(self.rate_limiter.wait)
+            async with self._semaphore:
+                response = await self._client.get(url, params=params)
+            self.rate_limiter.update(response.headers)
+
+            rate_limited = response.status_code == 429 or (
+                response.status_code == 403 and "rate limit" in response.text.lower()
+            )
+            if not rate_limited or attempt == MAX_RETRIES:
+                return response
+
+            retry_after = response.headers.get("retry-after")
+            await asyncio.sleep(int(retry_after) if retry_after else DEFAULT_RETRY_AFTER)
+
+        return response
+
+    async def get_tree(self, full_name: str, branch: str) -> Optional[dict[str, str]]:
+        """Get {path: type} for a branch with one recursive tree request (None if truncated)."""
+        response = await self._get(f"/repos/{full_name}/git/trees/{branch}", params={"recursive": 1})
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        if data.get("truncated"):
+            return None
+        return {entry["path"]: entry["type"] for entry in data["tree"]}
+
+    async def get_contributors_count(self, full_name: str) -> Optional[int]:
+        """Get number of contributors from the Link header of a per_page=1 request."""
+        response = await self._get(f"/repos/{full_name}/contributors", params={"per_page": 1})
+        if response.status_code == 204:
+            return 0
+        if response.status_code != 200:
+            return None
+
+        match = _LAST_PAGE_RE.search(response.headers.get("link", ""))
+        if match:
+            return int(match.group(1))
+        return len(response.json())
+
+    async def prefetch_repository(self, full_name: str, ref: str) -> dict[str, Any]:
+        """
+        Fetch the tree at ref (default branch name or head SHA, already known
+        from the bulk metadata fetch) and the contributor count concurrently.
+        """
+        tree, contributors = await asyncio.gather(
+            self.get_tree(full_name, ref),
+            self.get_contributors_count(full_name),
+        )
+        return {"tree": tree, "contributors": contributors}
+
+
+async def prefetch_repositories(refs: dict[str, str], token: Optional[str] = None) -> dict[str, dict]:
+    """
+    Prefetch trees and contributor counts for many repositories at once.
+
+    Args:
+        refs: Tree ref (default branch or head SHA) keyed by canonical full name
+        token: GitHub API token
+
+    Returns:
+        Dictionary keyed by full name; repositories that could not be
+        fetched are left out
+    """
+    full_names = list(refs)
+    async with AsyncGitHubClient(token) as client:
+        results = await asyncio.gather(
+            *(client.prefetch_repository(name, refs[name]) for name in full_names),
+            return_exceptions=True
+        )
+
+    prefetched = {}
+    for full_name, result in zip(full_names, results):
+        if isinstance(result, Exception):
+            continue
+        prefetched[full_name] = {key: value for key, value in result.items() if value is not None}
+    return prefetched
@@ -5,9 +5,30 @@ from dotenv import load_dotenv
 load_dotenv()
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+# Optional comma-separated tokens the web app rotates through (rate limits are per token)
+GITHUB_TOKENS = [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+if not GITHUB_TOKENS and GITHUB_TOKEN:
+    GITHUB_TOKENS = [GITHUB_TOKEN]
+
+# GraphQL endpoint used for bulk repository prefetching
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 50  # Repositories per GraphQL query (keeps node count low)
+SEARCH_BATCH_SIZE = 50  # repo: qualifiers per search query in GitHubClient.bulk_fetch
+HTTP_POOL_SIZE = 32  # Keep-alive connections per client (web app checks run many requests in parallel)
+
+# SQLite file for ETag-based response caching (empty string disables it)
+HTTP_CACHE_PATH = os.getenv("GITHUB_CACHE_PATH", ".gh_cache.sqlite")
+HTTP_CACHE_TTL = int(os.getenv("GITHUB_CACHE_TTL", "900"))  # Seconds served without revalidation
+
+# SQLite file caching verification reports by commit SHA (empty string disables it)
+REPORT_CACHE_PATH = os.getenv("REPORT_CACHE_PATH", ".report_cache.sqlite")
+REPORT_CACHE_MAX_AGE_DAYS = 7  # Re-verify after this long even if the SHA is unchanged
 
 # Supported languages (removed restriction - all languages accepted)
+# Set to a list of language names to restrict; stored as a frozenset for O(1) lookups
 SUPPORTED_LANGUAGES = None  # Accept all languages
+if SUPPORTED_LANGUAGES is not None:
+    SUPPORTED_LANGUAGES = frozenset(SUPPORTED_LANGUAGES)
 
 # Minimum requirements
 MIN_STARS = 200
@@ -19,6 +40,12 @@ MIN_FILES = 30  # Minimum number of files in repository
 MIN_DIRECTORIES = 8  # Minimum number of directories
 MAX_SIZE_MB = 500  # Maximum repository size in MB
 
+# Directories ignored when measuring complexity (matched as whole path segments)
+SKIP_DIRS = frozenset({
+    ".git", ".github", "node_modules", "__pycache__", ".pytest_cache",
+    "dist", "build", ".venv", "venv", "htmlcov"
+})
+
 # Pass threshold
 PASS_THRESHOLD = 75  # Minimum score percentage to pass (0-100)
 
@@ -39,6 +66,11 @@ LINTER_FILES = [
     "rustfmt.toml", ".prettierrc", "tslint.json"
 ]
 
+# Normalized (no trailing slash) path sets, matched in one pass against the repo tree
+TESTING_PATHS = frozenset(p.rstrip("/") for p in TESTING_FILES)
+BUILD_PATHS = frozenset(p.rstrip("/") for p in BUILD_FILES)
+LINTER_PATHS = frozenset(p.rstrip("/") for p in LINTER_FILES)
+
 # Network/port indicators (to avoid)
 NETWORK_INDICATORS = [
     "server.py", "app.py", "main.py:.*app.run",
@@ -1,22 +1,120 @@
 """GitHub API client wrapper."""
-from typing import Optional
+import itertools
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Collection, Iterable, Optional
 from datetime import datetime, timedelta, timezone
-from github import Github, GithubException
+import requests
+from requests.adapters import HTTPAdapter
+from github import Github, GithubException, GithubRetry, RateLimitExceededException
+from github.PaginatedList import PaginatedList
 from github.Repository import Repository
 
-from config import GITHUB_TOKEN
+from config import (
+    GITHUB_TOKEN,
+    GITHUB_GRAPHQL_URL,
+    GRAPHQL_BATCH_SIZE,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_TTL,
+    HTTP_POOL_SIZE,
+    SEARCH_BATCH_SIZE
+)
+from http_cache import ETagCache, install_requester
+from rate_limiter import RateLimiter
+from utils import parse_github_url
 from models import RepositoryInfo
 
+# Fields fetched per repository by the bulk GraphQL query
+_BULK_REPO_FIELDS = """
+    nameWithOwner
+    name
+    url
+    description
+    stargazerCount
+    forkCount
+    isFork
+    parent { stargazerCount }
+    primaryLanguage { name }
+    licenseInfo { name }
+    createdAt
+    updatedAt
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    defaultBranchRef { target { oid } }
+    object(expression: "HEAD:") { ... on Tree { entries { name type } } }
+"""
+
+
+def _parse_github_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as returned by the GraphQL API."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class GitHubClient:
     """Wrapper for GitHub API operations."""
 
-    def __init__(self, token: Optional[str] = None):
-        """Initialize GitHub client with token."""
+    def __init__(self, token: Optional[str] = None, github: Optional[Github] = None):
+        """
+        Initialize GitHub client with token.
+
+        Args:
+            token: GitHub token (defaults to GITHUB_TOKEN)
+            github: Existing PyGithub instance to reuse (see sharing())
+        """
         self.token = token or GITHUB_TOKEN
         if not self.token:
             raise ValueError("GitHub token is required. Set GITHUB_TOKEN in .env file")
-        self.client = Github(self.token)
+        self.rate_limiter = RateLimiter.shared(self.token)
+        if github is None:
+            # Retry 5xx, secondary rate limit 403s and 429s (honoring Retry-After) with jittered backoff
+            retry = GithubRetry(status_forcelist=list(range(500, 600)) + [429], backoff_factor=1, backoff_jitter=1)
+            github = Github(self.token, retry=retry, pool_size=HTTP_POOL_SIZE)
+            install_requester(
+                github,
+                cache=ETagCache.shared(HTTP_CACHE_PATH, HTTP_CACHE_TTL) if HTTP_CACHE_PATH else None,
+                rate_limiter=self.rate_limiter
+            )
+        self.client = github
+        self._session: Optional[requests.Session] = None
+        # Data prefetched in bulk, keyed by full name. Entries may hold
+        # "info" (RepositoryInfo), "root_entries" (top-level names),
+        # "head_sha" (default branch commit), "tree" ({path: type} of the
+        # whole default branch) and "contributors" (count)
+        self.prefetched: dict[str, dict] = {}
+        # Repository objects fetched during this run, keyed by full name
+        self._repo_cache: dict[str, Repository] = {}
+        # Contributor counts keyed by full name (search filter + verifier share them)
+        self._contributors_cache: dict[str, int] = {}
+        # Futures of recursive trees keyed by full name, resolving to
+        # ({path: type}, truncated) or None when the tree could not be fetched
+        self._tree_cache: dict[str, Future] = {}
+        # Futures of top-level entry names keyed by full name (fallback when
+        # the tree is unusable)
+        self._root_cache: dict[str, Future] = {}
+        # Guards only the two dicts above: concurrent checks of one repository
+        # share a single request while different repositories fetch in parallel
+        self._fetch_lock = threading.Lock()
+
+    @classmethod
+    def sharing(cls, other: "GitHubClient") -> "GitHubClient":
+        """
+        Create a client that reuses another client's connections but starts
+        with empty per-run caches (for long-lived processes like the web app).
+        """
+        client = cls(other.token, github=other.client)
+        client._session = other._graphql_session()
+        return client
+
+    @staticmethod
+    def parse_full_name(repo_url: str) -> str:
+        """Extract owner/repo from a GitHub URL (or return it unchanged)."""
+        if "github.com" in repo_url:
+            parsed = parse_github_url(repo_url)
+            if parsed is None:
+                raise ValueError(f"Invalid GitHub URL: {repo_url}")
+            owner, repo = parsed
+            return f"{owner}/{repo}"
+        return repo_url
 
     def get_repository(self, repo_url: str) -> Repository:
         """
@@ -28,76 +126,213 @@ class GitHubClient:
         Returns:
             Repository object
         """
-        # Extract owner/repo from URL
-        if "github.com" in repo_url:
-            parts = repo_url.rstrip("/").split("/")
-            if len(parts) >= 2:
-                owner = parts[-2]
-                repo = parts[-1]
-                full_name = f"{owner}/{repo}"
-            else:
-                raise ValueError(f"Invalid GitHub URL: {repo_url}")
-        else:
-            full_name = repo_url
+        full_name = self.parse_full_name(repo_url)
+        if full_name in self._repo_cache:
+            return self._repo_cache[full_name]
 
         try:
-            return self.client.get_repo(full_name)
+            repo = self.client.get_repo(full_name)
         except GithubException as e:
             raise ValueError(f"Could not fetch repository: {e}")
 
+        self._repo_cache[full_name] = repo
+        return repo
+
+    def _get_prefetched(self, repo: Repository, key: str):
+        """Get a prefetched value for a repository (None if not prefetched)."""
+        return self.prefetched.get(repo.full_name, {}).get(key)
+
     def get_repo_info(self, repo: Repository) -> RepositoryInfo:
         """Extract basic information from repository."""
-        stars = repo.stargazers_count
-        
-        # If it's a fork, always use parent's stars for evaluation
-        if repo.fork:
-            try:
-                parent = repo.parent
-                if parent:
-                    stars = parent.stargazers_count
-            except (GithubException, AttributeError):
-                pass
-        
+        info = self._get_prefetched(repo, "info")
+        if info is not None:
+            return info
+
         return RepositoryInfo(
             name=repo.name,
             full_name=repo.full_name,
             url=repo.html_url,
             description=repo.description,
-            stars=stars,
+            stars=self.get_effective_stars(repo),
             forks=repo.forks_count,
             language=repo.language,
             license=repo.license.name if repo.license else None,
             created_at=repo.created_at,
             updated_at=repo.updated_at,
-            topics=repo.get_topics()
+            # Topics are part of the standard repository payload; get_topics()
+            # would cost a separate request
+            topics=repo.topics or []
         )
 
+    @staticmethod
+    def get_effective_stars(repo: Repository) -> int:
+        """
+        Get stars used for evaluation: the parent's for forks.
+        
+        The full repository payload embeds a summary of the parent, so this
+        reads it from raw_data rather than building repo.parent.
+        """
+        if repo.fork:
+            parent = repo.raw_data.get("parent")
+            if parent and "stargazers_count" in parent:
+                return parent["stargazers_count"]
+        return repo.stargazers_count
+
     def get_contributors_count(self, repo: Repository) -> int:
-        """Get number of contributors to repository."""
-        try:
-            return repo.get_contributors().totalCount
-        except GithubException:
-            return 0
+        """
+        Get number of contributors to repository.
+        
+        totalCount issues a single per_page=1 request and reads the page
+        count from the Link header, so this costs one request per repository
+        per client; the result is memoized.
+        """
+        count = self._get_prefetched(repo, "contributors")
+        if count is not None:
+            return count
+
+        if repo.full_name not in self._contributors_cache:
+            try:
+                count = repo.get_contributors().totalCount
+            except RateLimitExceededException:
+                raise
+            except GithubException:
+                return 0
+            self._contributors_cache[repo.full_name] = count
+        return self._contributors_cache[repo.full_name]
 
     def has_recent_activity(self, repo: Repository, days: int = 180) -> bool:
         """Check if repository has activity in the last N days."""
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         return repo.updated_at > cutoff_date
 
+    def get_recursive_tree(self, repo: Repository) -> Optional[tuple[dict[str, str], bool]]:
+        """
+        Get every entry of the default branch with one recursive tree request.
+        
+        Returns:
+            ({path: type}, truncated) where type is "blob", "tree" or
+            "commit" (submodule) and truncated is True when GitHub cut the
+            listing short (very large repositories), or None if the tree
+            could not be fetched
+        """
+        tree = self._get_prefetched(repo, "tree")
+        if tree is not None:
+            return tree, False
+
+        def fetch() -> Optional[tuple[dict[str, str], bool]]:
+            try:
+                git_tree = repo.get_git_tree(sha=repo.default_branch, recursive=True)
+            except RateLimitExceededException:
+                raise
+            except GithubException:
+                return None
+            return {e.path: e.type for e in git_tree.tree}, bool(git_tree.raw_data.get("truncated"))
+
+        return self._fetch_once(self._tree_cache, repo.full_name, fetch)
+
+    def get_tree_paths(self, repo: Repository) -> Optional[Collection[str]]:
+        """
+        Get all file and directory paths of the default branch.
+        
+        Returns None when the tree is unavailable or truncated, in which
+        case callers should fall back to per-path lookups.
+        """
+        tree = self.get_recursive_tree(repo)
+        if tree is None or tree[1]:
+            return None
+        return tree[0].keys()
+
+    def _get_root_listing(self, repo: Repository) -> Optional[set[str]]:
+        """Get top-level entry names with one contents request (None on error); memoized."""
+        def fetch() -> Optional[set[str]]:
+            try:
+                contents = repo.get_contents("")
+            except RateLimitExceededException:
+                raise
+            except GithubException:
+                return None
+            contents = contents if isinstance(contents, list) else [contents]
+            return {c.name for c in contents}
+
+        return self._fetch_once(self._root_cache, repo.full_name, fetch)
+
+    def _fetch_once(self, cache: dict[str, Future], full_name: str, fetch: Callable[[], Any]) -> Any:
+        """Run fetch once per repository, even when threads ask for it concurrently."""
+        with self._fetch_lock:
+            future = cache.get(full_name)
+            owner = future is None
+            if owner:
+                future = cache[full_name] = Future()
+
+        if owner:
+            try:
+                future.set_result(fetch())
+            except BaseException as e:
+                future.set_exception(e)
+                # Let a retry (e.g. after a rate limit wait) fetch again
+                with self._fetch_lock:
+                    cache.pop(full_name, None)
+        return future.result()
+
+    def _get_path_index(self, repo: Repository, top_level: bool) -> Optional[Collection[str]]:
+        """
+        Get a collection of paths that existence checks can be answered from.
+        
+        Sources, cheapest first: the prefetched root listing, the recursive
+        tree and a fetched root listing (the listings only when every
+        queried path is top-level). None means paths must be looked up
+        one by one.
+        """
+        if top_level:
+            root_entries = self._get_prefetched(repo, "root_entries")
+            if root_entries is not None:
+                return root_entries
+
+        tree_paths = self.get_tree_paths(repo)
+        if tree_paths is not None:
+            return tree_paths
+
+        if top_level:
+            return self._get_root_listing(repo)
+        return None
+
     def check_file_exists(self, repo: Repository, path: str) -> bool:
         """Check if a file or directory exists in repository."""
+        name = path.rstrip("/")
+        index = self._get_path_index(repo, top_level="/" not in name)
+        if index is not None:
+            return name in index
+
+        return self._fetch_file_exists(repo, path)
+
+    def _fetch_file_exists(self, repo: Repository, path: str) -> bool:
+        """Check if a path exists with a contents API request."""
         try:
             result = repo.get_contents(path)
             return result is not None
+        except RateLimitExceededException:
+            raise
         except (GithubException, TypeError, AttributeError):
             return False
 
-    def check_any_file_exists(self, repo: Repository, patterns: list[str]) -> bool:
-        """Check if any file matching patterns exists."""
-        for pattern in patterns:
-            if self.check_file_exists(repo, pattern):
-                return True
-        return False
+    def check_any_file_exists(self, repo: Repository, patterns: Iterable[str]) -> bool:
+        """
+        Check if any file matching patterns exists.
+        
+        Accepts a list of patterns or a precomputed frozenset of normalized
+        paths (see config.TESTING_PATHS); either way the lookup is a single
+        set intersection against one shared path index.
+        """
+        if isinstance(patterns, frozenset):
+            names = patterns
+        else:
+            names = frozenset(p.rstrip("/") for p in patterns)
+
+        index = self._get_path_index(repo, top_level=all("/" not in n for n in names))
+        if index is not None:
+            return not names.isdisjoint(index)
+
+        return any(self._fetch_file_exists(repo, name) for name in names)
 
     def get_repo_files(self, repo: Repository, path: str = "") -> list[str]:
         """Get list of files in repository path."""
@@ -132,13 +367,189 @@ class GitHubClient:
         Returns:
             List of Repository objects
         """
+        results = self.iter_search_repositories(
+            query, language=language, min_stars=min_stars, per_page=max_results
+        )
+        try:
+            return list(itertools.islice(results, max_results))
+        except GithubException as e:
+            raise ValueError(f"Search failed: {e}")
+
+    def iter_search_repositories(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        min_stars: int = 10,
+        per_page: int = 30
+    ) -> PaginatedList[Repository]:
+        """
+        Search for repositories, fetching result pages lazily.
+        
+        Nothing is requested until iteration starts and each further page is
+        only requested once the previous one is exhausted, so callers that
+        filter results can stop as soon as they have enough.
+        
+        Args:
+            query: Search query string
+            language: Programming language filter
+            min_stars: Minimum number of stars
+            per_page: Results per page request (capped at 100)
+            
+        Returns:
+            PaginatedList of Repository objects
+        """
         search_query = f"{query} stars:>={min_stars}"
         
         if language:
             search_query += f" language:{language}"
 
-        try:
-            results = self.client.search_repositories(query=search_query, sort="stars")
-            return list(results[:max_results])
-        except GithubException as e:
-            raise ValueError(f"Search failed: {e}")
+        return self._search_repositories({"q": search_query, "sort": "stars"}, per_page)
+
+    def _search_repositories(self, parameters: dict[str, str], per_page: int) -> PaginatedList[Repository]:
+        """
+        Build a lazy repository search with its own page size.
+
+        The page size goes into the request parameters instead of
+        Github.per_page, which is shared by every client using the same
+        Github instance (see sharing()) and by every PaginatedList it builds.
+        """
+        return PaginatedList(
+            Repository,
+            self.client._Github__requester,
+            "/search/repositories",
+            {**parameters, "per_page": min(100, per_page)}
+        )
+
+    def bulk_fetch(self, full_names: list[str]) -> dict[str, Repository]:
+        """
+        Fetch Repository objects for many repositories with batched search queries.
+        
+        Each query ORs ``repo:`` qualifiers together, so a batch of
+        repositories costs one search request instead of one
+        ``GET /repos/{owner}/{repo}`` each. Results are also stored in the
+        repository cache used by get_repository.
+        
+        Args:
+            full_names: Repositories in owner/repo format
+            
+        Returns:
+            Dictionary mapping requested full name to Repository; repositories
+            the search doesn't return (private, renamed, failed batch) are omitted
+        """
+        # Search results spell names as GitHub does, which may differ in case
+        requested = {name.lower(): name for name in full_names}
+        results = {}
+
+        for start in range(0, len(full_names), SEARCH_BATCH_SIZE):
+            batch = full_names[start:start + SEARCH_BATCH_SIZE]
+            # Forks are excluded from search results unless asked for
+            query = " ".join(f"repo:{name}" for name in batch) + " fork:true"
+            try:
+                for repo in self._search_repositories({"q": query}, per_page=100):
+                    full_name = requested.get(repo.full_name.lower())
+                    if full_name is not None:
+                        results[full_name] = repo
+                        self._repo_cache[full_name] = repo
+            except GithubException:
+                continue
+
+        return results
+
+    def get_repos_bulk(self, full_names: list[str]) -> dict[str, RepositoryInfo]:
+        """
+        Fetch basic information for many repositories with batched GraphQL queries.
+        
+        Results (and each repository's top-level file listing) are stored in
+        ``self.prefetched`` so later REST-based checks can reuse them.
+        Repositories the GraphQL API cannot resolve fall back to REST.
+        
+        Args:
+            full_names: Repositories in owner/repo format
+            
+        Returns:
+            Dictionary mapping requested full name to RepositoryInfo
+        """
+        results = {}
+
+        for start in range(0, len(full_names), GRAPHQL_BATCH_SIZE):
+            batch = full_names[start:start + GRAPHQL_BATCH_SIZE]
+            try:
+                nodes = self._graphql_repositories(batch)
+            except (requests.RequestException, ValueError):
+                nodes = [None] * len(batch)
+
+            for full_name, node in zip(batch, nodes):
+                if node is not None:
+                    info = self._repo_info_from_graphql(node)
+                    tree = node.get("object")
+                    root_entries = {e["name"] for e in tree["entries"]} if tree else None
+                    entry = self.prefetched.setdefault(info.full_name, {})
+                    entry["info"] = info
+                    if root_entries is not None:
+                        entry["root_entries"] = root_entries
+                    if node.get("defaultBranchRef"):
+                        entry["head_sha"] = node["defaultBranchRef"]["target"]["oid"]
+                    results[full_name] = info
+                    continue
+
+                # REST fallback
+                try:
+                    results[full_name] = self.get_repo_info(self.get_repository(full_name))
+                except ValueError:
+                    continue
+
+        return results
+
+    def _graphql_session(self) -> requests.Session:
+        """Get the pooled session used for GraphQL requests, creating it on first use."""
+        if self._session is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            self._session = requests.Session()
+            self._session.mount("https://", adapter)
+            self._session.headers["Authorization"] = f"bearer {self.token}"
+        return self._session
+
+    def _graphql_repositories(self, full_names: list[str]) -> list[Optional[dict]]:
+        """Run one aliased GraphQL query returning a node (or None) per repository."""
+        aliases = []
+        for i, full_name in enumerate(full_names):
+            owner, _, name = full_name.partition("/")
+            aliases.append(
+                f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{{_BULK_REPO_FIELDS}}}"
+            )
+        query = "query {\n" + "\n".join(aliases) + "\n}"
+
+        response = self._graphql_session().post(GITHUB_GRAPHQL_URL, json={"query": query}, timeout=30)
+        response.raise_for_status()
+        data = response.json().get("data")
+        if not data:
+            raise ValueError("GraphQL query returned no data")
+
+        return [data.get(f"r{i}") for i in range(len(full_names))]
+
+    @staticmethod
+    def _repo_info_from_graphql(node: dict) -> RepositoryInfo:
+        """Build RepositoryInfo from a GraphQL repository node."""
+        stars = node["stargazerCount"]
+
+        # If it's a fork, always use parent's stars for evaluation
+        if node.get("isFork") and node.get("parent"):
+            stars = node["parent"]["stargazerCount"]
+
+        language = node.get("primaryLanguage")
+        license_info = node.get("licenseInfo")
+        topics = node.get("repositoryTopics") or {"nodes": []}
+
+        return RepositoryInfo(
+            name=node["name"],
+            full_name=node["nameWithOwner"],
+            url=node["url"],
+            description=node.get("description"),
+            stars=stars,
+            forks=node["forkCount"],
+            language=language["name"] if language else None,
+            license=license_info["name"] if license_info else None,
+            created_at=_parse_github_datetime(node["createdAt"]),
+            updated_at=_parse_github_datetime(node["updatedAt"]),
+            topics=[t["topic"]["name"] for t in topics["nodes"]]
+        )
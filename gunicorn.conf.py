@@ -0,0 +1,18 @@
+"""Gunicorn settings for serving the web interface (gunicorn wsgi:app)."""
+import os
+
+import config
+
+bind = os.getenv("BIND", "0.0.0.0:5000")
+# Threaded workers: verifications spend their time waiting on GitHub, and the
+# clients, caches and check fan-out already rely on real threads and locks
+worker_class = "gthread"
+workers = int(os.getenv("WEB_WORKERS", "4"))
+threads = int(os.getenv("WEB_THREADS", "32"))
+# Uncached searches with verification can take a while
+timeout = 120
+
+
+def when_ready(server):
+    """Log the token pool size once, from the master (the app logger is at WARNING)."""
+    server.log.info("Rotating across %d GitHub token(s)", len(config.GITHUB_TOKENS))
@@ -0,0 +1,207 @@
+"""Conditional-request (ETag) caching and throttling for GitHub API calls."""
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+from github import Github
+from github.Requester import HTTPSRequestsConnectionClass, Requester
+
+from rate_limiter import RateLimiter
+
+
+class ETagCache:
+    """SQLite store of GitHub responses keyed by request URL."""
+
+    _instances: dict[str, "ETagCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str, expire_after: Optional[int] = None):
+        """
+        Initialize cache stored in the given SQLite file.
+
+        Args:
+            path: SQLite database file
+            expire_after: Seconds a stored response is served without
+                revalidation (None or 0 always revalidates)
+        """
+        self.path = path
+        self.expire_after = expire_after
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # GET outcomes: "fresh" (no request), "not_modified" (304), "miss"
+        self.stats: Counter = Counter()
+
+    @classmethod
+    def shared(cls, path: str, expire_after: Optional[int] = None) -> "ETagCache":
+        """Get the cache instance for a path (one connection per file per process)."""
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path, expire_after)
+            return cls._instances[path]
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            # WAL lets other processes (CLI and web app) read while one writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, etag TEXT, body BLOB, headers BLOB, stored_at REAL DEFAULT 0)"
+            )
+            # Files created before stored_at existed: rows count as stale
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "stored_at" not in columns:
+                self._conn.execute("ALTER TABLE responses ADD COLUMN stored_at REAL DEFAULT 0")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[tuple[str, str, dict[str, Any], bool]]:
+        """Get (etag, body, headers, fresh) for a key, or None if not cached."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT etag, body, headers, stored_at FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, body, headers, stored_at = row
+        fresh = bool(self.expire_after) and time.time() - stored_at < self.expire_after
+        return etag, body, json.loads(headers), fresh
+
+    def set(self, key: str, etag: str, body: str, headers: dict[str, Any]) -> None:
+        """Store a response for a key."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, body, headers, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, body, json.dumps(headers), time.time())
+            )
+            conn.commit()
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome (see stats)."""
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def touch(self, key: str) -> None:
+        """Mark a stored response as fresh again (after a 304 revalidation)."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("UPDATE responses SET stored_at = ? WHERE url = ?", (time.time(), key))
+            conn.commit()
+
+
+def _per_thread(name: str) -> property:
+    """Attribute stored separately for each thread."""
+    return property(
+        lambda self: getattr(self._local, name),
+        lambda self, value: setattr(self._local, name, value)
+    )
+
+
+class ThreadSafeHTTPSConnection(HTTPSRequestsConnectionClass):
+    """
+    PyGithub's persistent connection, safe to share between threads.
+
+    PyGithub stores the pending request on the connection between request()
+    and getresponse(), so two threads sharing it could send each other's
+    requests; keeping those fields per thread fixes that while every thread
+    still uses the one pooled requests.Session.
+    """
+
+    verb = _per_thread("verb")
+    url = _per_thread("url")
+    input = _per_thread("input")
+    headers = _per_thread("headers")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+
+class GitHubRequester(Requester):
+    """
+    PyGithub requester that answers GET requests from the cache while fresh,
+    revalidates them with If-None-Match afterwards and waits for the rate
+    limit reset when the budget runs low.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ETagCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        **kwargs: Any
+    ):
+        """Initialize requester with optional cache/limiter and the usual Requester arguments."""
+        super().__init__(**kwargs)
+        # Clients (and Repository objects) are shared by concurrent checks
+        if self._Requester__connectionClass is HTTPSRequestsConnectionClass:
+            self._Requester__connectionClass = ThreadSafeHTTPSConnection
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+    @staticmethod
+    def _cache_key(url: str, parameters: Optional[dict[str, Any]], headers: Optional[dict[str, Any]]) -> str:
+        """Build a cache key from URL, query parameters and Accept header."""
+        key = url
+        if parameters:
+            key += "?" + urlencode(sorted(parameters.items()))
+        accept = (headers or {}).get("Accept")
+        if accept:
+            key += f"|{accept}"
+        return key
+
+    def requestJson(self, verb, url, parameters=None, headers=None, input=None, cnx=None):
+        """Send a request, answering fresh hits and 304 Not Modified responses from the cache."""
+        if verb != "GET" or self.cache is None:
+            return self._send(verb, url, parameters, headers, input, cnx)
+
+        key = self._cache_key(url, parameters, headers)
+        cached = self.cache.get(key)
+        if cached and cached[3]:
+            self.cache.record("fresh")
+            return 200, cached[2], cached[1]
+
+        request_headers = dict(headers or {})
+        if cached:
+            request_headers["If-None-Match"] = cached[0]
+
+        status, response_headers, output = self._send(
+            verb, url, parameters, request_headers, input, cnx
+        )
+
+        if status == 304 and cached:
+            # Not modified: doesn't count against the rate limit
+            self.cache.touch(key)
+            self.cache.record("not_modified")
+            return 200, cached[2], cached[1]
+        self.cache.record("miss")
+
+        etag = response_headers.get("etag")
+        if status == 200 and etag:
+            self.cache.set(key, etag, output, response_headers)
+
+        return status, response_headers, output
+
+    def _send(self, verb, url, parameters, headers, input, cnx):
+        """Send a request and record the rate limit budget it reports."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        status, response_headers, output = super().requestJson(verb, url, parameters, headers, input, cnx)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response_headers)
+        return status, response_headers, output
+
+
+def install_requester(
+    client: Github,
+    cache: Optional[ETagCache] = None,
+    rate_limiter: Optional[RateLimiter] = None
+) -> None:
+    """Replace a Github instance's requester with a GitHubRequester."""
+    requester = client._Github__requester
+    client._Github__requester = GitHubRequester(cache, rate_limiter, **requester.kwargs)
@@ -89,29 +89,38 @@ def cli():
 
 
 @cli.command()
-@click.argument('repo_url')
+@click.argument('repo_urls', nargs=-1, required=True)
 @click.option('--token', '-t', help='GitHub API token (or use GITHUB_TOKEN env var)')
-def verify(repo_url, token):
+def verify(repo_urls, token):
     """
-    Verify a repository against quality requirements.
+    Verify one or more repositories against quality requirements.
     
-    REPO_URL: GitHub repository URL or owner/repo format
+    REPO_URLS: GitHub repository URLs or owner/repo format
     
-    Example: python main.py verify https://github.com/pallets/flask
+    Example: python main.py verify https://github.com/pallets/flask pallets/click
     """
     try:
-        console.print(f"[cyan]Verifying repository: {repo_url}[/cyan]\n")
-        
         client = GitHubClient(token)
         verifier = RepositoryVerifier(client)
         
-        with console.status("[bold green]Checking requirements..."):
-            report = verifier.verify_repository(repo_url)
+        if len(repo_urls) == 1:
+            console.print(f"[cyan]Verifying repository: {repo_urls[0]}[/cyan]\n")
+            with console.status("[bold green]Checking requirements..."):
+                reports = [verifier.verify_repository(repo_urls[0])]
+        else:
+            # Several repositories: prefetch their shared data in bulk
+            console.print(f"[cyan]Verifying {len(repo_urls)} repositories[/cyan]\n")
+            with console.status("[bold green]Checking requirements..."):
+                reports = verifier.verify_repositories(list(repo_urls))
         
-        print_verification_report(report)
+        for repo_url, report in zip(repo_urls, reports):
+            if report is None:
+                console.print(f"[bold red]Error:[/bold red] Could not fetch repository: {repo_url}")
+            else:
+                print_verification_report(report)
         
         # Exit with appropriate code
-        sys.exit(0 if report.passed else 1)
+        sys.exit(0 if all(report is not None and report.passed for report in reports) else 1)
         
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -184,24 +193,22 @@ def diverse(language, count, no_verify, token):
         
         console.print(f"[cyan]Finding diverse {language} codebases...[/cyan]\n")
         
-        categories = {
-            "Libraries": ["library"],
-            "Applications": ["application", "app"],
-            "SDKs": ["sdk"],
-            "Frameworks": ["framework"]
+        with console.status("[bold green]Searching libraries, applications, SDKs and frameworks..."):
+            results_by_type = searcher.search_diverse_codebases(
+                language, count_per_type=count, verify=not no_verify
+            )
+        
+        titles = {
+            "libraries": "Libraries",
+            "applications": "Applications",
+            "sdks": "SDKs",
+            "frameworks": "Frameworks"
         }
         
-        for category, topics in categories.items():
-            with console.status(f"[bold green]Searching {category.lower()}..."):
-                criteria = SearchCriteria(
-                    language=language,
-                    topics=topics,
-                    max_results=count
-                )
-                results = searcher.search_repositories(criteria, verify=not no_verify)
-            
+        for key, title in titles.items():
+            results = results_by_type[key]
             if results:
-                print_search_results(results, title=category)
+                print_search_results(results, title=title)
                 console.print()
         
     except Exception as e:
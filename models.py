@@ -1,25 +1,50 @@
 """Data models for repository verification."""
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
 
+import config
 
-class RepositoryInfo(BaseModel):
+
+@dataclass(slots=True)
+class RepositoryInfo:
     """Repository basic information."""
     name: str
     full_name: str
     url: str
+    created_at: datetime
+    updated_at: datetime
     description: Optional[str] = None
     stars: int = 0
     forks: int = 0
     language: Optional[str] = None
     license: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
-    topics: list[str] = Field(default_factory=list)
+    topics: list[str] = field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RepositoryInfo":
+        """Build from a dict produced by dataclasses.asdict (datetimes as ISO strings)."""
+        return cls(**{
+            **data,
+            "created_at": datetime.fromisoformat(data["created_at"]),
+            "updated_at": datetime.fromisoformat(data["updated_at"]),
+        })
 
-class RequirementCheck(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Verification thresholds (defaults from config; hashable for cache keys)."""
+    min_stars: int = config.MIN_STARS
+    min_contributors: int = config.MIN_CONTRIBUTORS
+    min_files: int = config.MIN_FILES
+    min_directories: int = config.MIN_DIRECTORIES
+    max_size_mb: int = config.MAX_SIZE_MB
+    activity_days: int = config.ACTIVITY_DAYS
+    pass_threshold: int = config.PASS_THRESHOLD
+
+
+@dataclass(slots=True)
+class RequirementCheck:
     """Single requirement check result."""
     name: str
     passed: bool
@@ -27,14 +52,15 @@ class RequirementCheck(BaseModel):
     severity: str = "error"  # error, warning, info
 
 
-class VerificationReport(BaseModel):
+@dataclass(slots=True)
+class VerificationReport:
     """Complete verification report for a repository."""
     repository: RepositoryInfo
     checks: list[RequirementCheck]
     score: float  # 0-100
     passed: bool
     summary: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
 
     def get_failed_checks(self) -> list[RequirementCheck]:
         """Get all failed requirement checks."""
@@ -44,11 +70,24 @@ class VerificationReport(BaseModel):
         """Get all warning checks."""
         return [check for check in self.checks if not check.passed and check.severity == "warning"]
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "VerificationReport":
+        """Build from a dict produced by dataclasses.asdict (datetimes as ISO strings)."""
+        return cls(
+            repository=RepositoryInfo.from_dict(data["repository"]),
+            checks=[RequirementCheck(**check) for check in data["checks"]],
+            score=data["score"],
+            passed=data["passed"],
+            summary=data["summary"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+
 
-class SearchCriteria(BaseModel):
+@dataclass(slots=True)
+class SearchCriteria:
     """Search criteria for finding repositories."""
     language: Optional[str] = None
-    topics: list[str] = Field(default_factory=list)
+    topics: list[str] = field(default_factory=list)
     min_stars: int = 10
     min_contributors: int = 2
     has_tests: bool = False
@@ -0,0 +1,93 @@
+"""Primary rate limit gating for GitHub API calls."""
+import itertools
+import threading
+import time
+from typing import Any, Optional, Sequence
+
+# Start waiting for the reset once fewer requests than this remain
+LOW_WATER_MARK = 50
+
+
+class RateLimiter:
+    """Track X-RateLimit-* headers and block before the budget runs out."""
+
+    _instances: dict[str, "RateLimiter"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, low_water_mark: int = LOW_WATER_MARK):
+        """Initialize limiter with the remaining-requests threshold."""
+        self.low_water_mark = low_water_mark
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key: str) -> "RateLimiter":
+        """Get the limiter for a key (rate limits are per token, shared by its clients)."""
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls()
+            return cls._instances[key]
+
+    def update(self, headers: dict[str, Any]) -> None:
+        """Record the budget reported by a response's headers."""
+        if "x-ratelimit-remaining" not in headers:
+            return
+        # The search API has its own, much smaller budget; don't let it gate core calls
+        if headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        with self._lock:
+            self.remaining = int(float(headers["x-ratelimit-remaining"]))
+            if "x-ratelimit-reset" in headers:
+                self.reset_at = float(headers["x-ratelimit-reset"])
+
+    def exhausted(self) -> bool:
+        """Whether the budget is below the low-water mark and hasn't reset yet."""
+        with self._lock:
+            return (
+                self.remaining is not None
+                and self.remaining < self.low_water_mark
+                and self.reset_at > time.time()
+            )
+
+    def wait(self) -> None:
+        """Sleep until the reset time if the remaining budget is below the low-water mark."""
+        with self._lock:
+            if self.remaining is None or self.remaining >= self.low_water_mark:
+                return
+            delay = self.reset_at - time.time()
+            if delay <= 0:
+                self.remaining = None
+                return
+        time.sleep(delay)
+        with self._lock:
+            self.remaining = None
+
+
+class TokenPool:
+    """Hand out tokens round-robin, skipping ones whose rate limit is exhausted."""
+
+    def __init__(self, tokens: Sequence[str]):
+        """Initialize pool with one or more tokens."""
+        if not tokens:
+            raise ValueError("At least one GitHub token is required")
+        self.tokens = list(dict.fromkeys(tokens))
+        self._cycle = itertools.cycle(self.tokens)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def next_token(self) -> str:
+        """
+        Get the next token with budget left.
+
+        When every token is exhausted, returns the one that resets first
+        (its RateLimiter then waits for the reset).
+        """
+        with self._lock:
+            for _ in range(len(self.tokens)):
+                token = next(self._cycle)
+                if not RateLimiter.shared(token).exhausted():
+                    return token
+        return min(self.tokens, key=lambda t: RateLimiter.shared(t).reset_at)
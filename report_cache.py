@@ -0,0 +1,68 @@
+"""Persistent cache of verification reports keyed by repository and commit SHA."""
+import json
+import sqlite3
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Optional
+
+from models import VerificationReport
+
+
+class ReportCache:
+    """SQLite store of VerificationReport objects keyed by (full_name, sha)."""
+
+    def __init__(self, path: str, max_age_seconds: Optional[int] = None):
+        """
+        Initialize cache stored in the given SQLite file.
+
+        Args:
+            path: SQLite database file
+            max_age_seconds: Ignore reports older than this (time-based checks
+                such as Recent Activity drift even when the SHA is unchanged)
+        """
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reports ("
+                "full_name TEXT, sha TEXT, report_json TEXT, ts INTEGER, "
+                "PRIMARY KEY (full_name, sha))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, full_name: str, sha: str) -> Optional[VerificationReport]:
+        """Get the cached report for a repository at a commit, if still fresh."""
+        row = self._connection().execute(
+            "SELECT report_json, ts FROM reports WHERE full_name = ? AND sha = ?",
+            (full_name, sha)
+        ).fetchone()
+        if row is None:
+            return None
+
+        report_json, ts = row
+        if self.max_age_seconds is not None and time.time() - ts > self.max_age_seconds:
+            return None
+        return VerificationReport.from_dict(json.loads(report_json))
+
+    def set(self, full_name: str, sha: str, report: VerificationReport) -> None:
+        """Store the report for a repository at a commit (replacing older SHAs)."""
+        conn = self._connection()
+        conn.execute("DELETE FROM reports WHERE full_name = ?", (full_name,))
+        conn.execute(
+            "INSERT INTO reports (full_name, sha, report_json, ts) VALUES (?, ?, ?, ?)",
+            (full_name, sha, json.dumps(asdict(report), default=datetime.isoformat), int(time.time()))
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,4 +1,6 @@
 """Repository search module."""
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from github.Repository import Repository
 
@@ -6,6 +8,11 @@ from github_client import GitHubClient
 from models import SearchCriteria, RepositoryInfo
 from verifier import RepositoryVerifier
 
+# Stop scanning search results after this many candidates per requested result
+# (bounds contributor/verification requests on criteria few repositories meet;
+# matches the old fixed *2 overfetch so strict filters cost no more than before)
+MAX_CANDIDATES_PER_RESULT = 2
+
 
 class RepositorySearcher:
     """Search for repositories matching criteria."""
@@ -43,17 +50,18 @@ class RepositorySearcher:
         
         query = " ".join(query_parts) if query_parts else "stars:>0"
         
-        # Search repositories
-        repos = self.client.search_repositories(
+        # Search repositories; pages are fetched only as the loop needs them
+        repos = self.client.iter_search_repositories(
             query=query,
             language=criteria.language,
             min_stars=criteria.min_stars,
-            max_results=criteria.max_results * 2  # Get more to filter
+            per_page=criteria.max_results * 2
         )
+        candidates = itertools.islice(repos, criteria.max_results * MAX_CANDIDATES_PER_RESULT)
         
         results = []
         
-        for repo in repos:
+        for repo in candidates:
             # Filter by contributors
             contributors = self.client.get_contributors_count(repo)
             if contributors < criteria.min_contributors:
@@ -64,7 +72,7 @@ class RepositorySearcher:
             if verify:
                 # Verify the repository
                 try:
-                    report = self.verifier.verify_repository(repo.html_url)
+                    report = self.verifier.verify_repository(repo)
                     if report.passed:
                         results.append((repo_info, report.score))
                 except Exception as e:
@@ -111,58 +119,40 @@ class RepositorySearcher:
     def search_diverse_codebases(
         self,
         language: str,
-        count_per_type: int = 3
-    ) -> dict[str, list[tuple[RepositoryInfo, float]]]:
+        count_per_type: int = 3,
+        verify: bool = True
+    ) -> dict[str, list[tuple[RepositoryInfo, Optional[float]]]]:
         """
         Search for diverse codebases (libraries, apps, SDKs).
         
+        The four category searches are independent and run concurrently.
+        
         Args:
             language: Programming language to filter
             count_per_type: Number of results per type
+            verify: Whether to verify each result
             
         Returns:
             Dictionary with codebase types as keys
         """
-        results = {
-            "libraries": [],
-            "applications": [],
-            "sdks": [],
-            "frameworks": []
+        category_topics = {
+            "libraries": ["library"],
+            "applications": ["application", "app"],
+            "sdks": ["sdk"],
+            "frameworks": ["framework"]
         }
         
-        # Search for libraries
-        lib_criteria = SearchCriteria(
-            language=language,
-            topics=["library"],
-            max_results=count_per_type
-        )
-        results["libraries"] = self.search_repositories(lib_criteria, verify=True)
-        
-        # Search for applications
-        app_criteria = SearchCriteria(
-            language=language,
-            topics=["application", "app"],
-            max_results=count_per_type
-        )
-        results["applications"] = self.search_repositories(app_criteria, verify=True)
-        
-        # Search for SDKs
-        sdk_criteria = SearchCriteria(
-            language=language,
-            topics=["sdk"],
-            max_results=count_per_type
-        )
-        results["sdks"] = self.search_repositories(sdk_criteria, verify=True)
-        
-        # Search for frameworks
-        framework_criteria = SearchCriteria(
-            language=language,
-            topics=["framework"],
-            max_results=count_per_type
-        )
-        results["frameworks"] = self.search_repositories(framework_criteria, verify=True)
-        
-        return results
+        # Categories share this client; its requester keeps each thread's request apart
+        with ThreadPoolExecutor(max_workers=len(category_topics)) as executor:
+            futures = {
+                category: executor.submit(
+                    self.search_repositories,
+                    SearchCriteria(language=language, topics=topics, max_results=count_per_type),
+                    verify
+                )
+                for category, topics in category_topics.items()
+            }
+            return {category: future.result() for category, future in futures.items()}
 
     def get_recommendations(
         self,
@@ -2,17 +2,28 @@
 Unit tests for GitHub Repository Checker.
 Run with: pytest test_checker.py
 """
+import threading
+import time
+import orjson
 import pytest
-from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime, timedelta, timezone
+from github import GithubException, RateLimitExceededException
+from github.Repository import Repository
 
 from models import (
     RepositoryInfo,
     RequirementCheck,
-    SearchCriteria
+    SearchCriteria,
+    Settings
 )
 from github_client import GitHubClient
 from verifier import RepositoryVerifier
+from searcher import RepositorySearcher
+
+# Fixed reference time so fixtures are deterministic
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 class TestModels:
@@ -27,8 +38,8 @@ class TestModels:
             stars=100,
             language="Python",
             license="MIT",
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=_NOW,
+            updated_at=_NOW
         )
         
         assert repo.name == "test-repo"
@@ -60,53 +71,254 @@ class TestModels:
 class TestGitHubClient:
     """Test GitHub client."""
     
-    def test_extract_owner_repo_from_url(self):
+    @pytest.fixture
+    def offline_client(self):
+        """Create a client whose PyGithub instance is a mock (no network, no auth)."""
+        with patch("github_client.Github") as github_cls, patch("github_client.install_requester"):
+            yield GitHubClient(token="test_token"), github_cls.return_value
+    
+    @pytest.mark.parametrize("url", [
+        "https://github.com/owner/repo",
+        "https://github.com/owner/repo/",
+        "http://github.com/owner/repo",
+        "https://github.com/owner/repo?tab=readme-ov-file",
+        "https://github.com/owner/repo.git",
+        "https://github.com/owner/repo/tree/main#L1",
+        "owner/repo",
+    ])
+    def test_extract_owner_repo_from_url(self, offline_client, url):
         """Test extracting owner/repo from various URL formats."""
+        client, github = offline_client
+        
+        assert client.parse_full_name(url) == "owner/repo"
+        assert client.get_repository(url) is github.get_repo.return_value
+        github.get_repo.assert_called_once_with("owner/repo")
+    
+    def test_sharing_reuses_connections_not_caches(self, offline_client):
+        """Test that a shared client reuses the PyGithub instance but starts with empty memos."""
+        client, github = offline_client
+        client.get_repository("owner/repo")
+        
+        shared = GitHubClient.sharing(client)
+        shared.get_repository("owner/repo")
+        
+        assert shared.client is github
+        assert shared._graphql_session() is client._graphql_session()
+        assert github.get_repo.call_count == 2
+    
+    def test_get_repository_is_cached(self):
+        """Test that the same repository is only fetched once per client."""
         client = GitHubClient(token="test_token")
         
-        test_cases = [
-            "https://github.com/owner/repo",
-            "https://github.com/owner/repo/",
-            "http://github.com/owner/repo",
-        ]
+        with patch.object(client.client, 'get_repo') as mock_get:
+            first = client.get_repository("https://github.com/owner/repo")
+            second = client.get_repository("owner/repo")
+        
+        assert first is second
+        mock_get.assert_called_once_with("owner/repo")
+    
+    def test_effective_stars_of_fork_come_from_embedded_parent(self):
+        """Test that fork stars are read from the payload without fetching the parent."""
+        repo = Mock(fork=True, stargazers_count=3, raw_data={"parent": {"stargazers_count": 900}})
+        
+        assert GitHubClient.get_effective_stars(repo) == 900
+        assert GitHubClient.get_effective_stars(Mock(fork=False, stargazers_count=3)) == 3
+    
+    def test_get_contributors_count_is_memoized(self):
+        """Test that search filtering and verification share one contributors request."""
+        client = GitHubClient(token="test_token")
+        repo = Mock(full_name="owner/repo")
+        repo.get_contributors.return_value = Mock(totalCount=7)
+        
+        assert client.get_contributors_count(repo) == 7
+        assert client.get_contributors_count(repo) == 7
+        repo.get_contributors.assert_called_once()
+    
+    def test_search_repositories_sizes_page_to_max_results(self):
+        """Test that search requests one page of max_results items."""
+        client = GitHubClient(token="test_token")
         
-        for url in test_cases:
-            with patch.object(client.client, 'get_repo') as mock_get:
-                mock_repo = Mock()
-                mock_get.return_value = mock_repo
-                
-                try:
-                    result = client.get_repository(url)
-                    assert result is not None
-                except Exception:
-                    pass  # Expected if token is invalid
+        with patch.object(client, "_search_repositories", return_value=iter(range(100))) as search:
+            results = client.search_repositories("cli", max_results=5)
+        
+        assert results == [0, 1, 2, 3, 4]
+        assert search.call_args.args[1] == 5
+    
+    def test_search_page_size_does_not_touch_shared_client(self):
+        """Test that the page size is a request parameter, not Github.per_page state."""
+        client = GitHubClient(token="test_token")
+        
+        results = client.iter_search_repositories("cli", per_page=5)
+        
+        assert results._PaginatedList__nextParams["per_page"] == 5
+        assert client.client.per_page == 30
+    
+    def test_get_repos_bulk_uses_graphql_and_falls_back(self):
+        """Test bulk prefetch parses GraphQL nodes and falls back to REST."""
+        client = GitHubClient(token="test_token")
+        node = {
+            "nameWithOwner": "owner/repo",
+            "name": "repo",
+            "url": "https://github.com/owner/repo",
+            "description": "A repository",
+            "stargazerCount": 10,
+            "forkCount": 2,
+            "isFork": True,
+            "parent": {"stargazerCount": 500},
+            "primaryLanguage": {"name": "Python"},
+            "licenseInfo": {"name": "MIT License"},
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-06-01T00:00:00Z",
+            "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+            "object": {"entries": [{"name": "tests", "type": "tree"}, {"name": "README.md", "type": "blob"}]},
+        }
+        fallback_info = Mock()
+        
+        with patch.object(client, "_graphql_repositories", return_value=[node, None]), \
+             patch.object(client, "get_repository"), \
+             patch.object(client, "get_repo_info", return_value=fallback_info):
+            results = client.get_repos_bulk(["owner/repo", "owner/missing"])
+        
+        assert results["owner/repo"].stars == 500
+        assert results["owner/repo"].topics == ["cli"]
+        assert results["owner/missing"] is fallback_info
+        
+        repo = Mock(full_name="owner/repo")
+        assert client.check_file_exists(repo, "tests/") is True
+        assert client.check_file_exists(repo, "pytest.ini") is False
+
+    
+    def test_bulk_fetch_batches_repo_qualifiers(self):
+        """Test bulk fetch issues one search per batch and primes the repository cache."""
+        client = GitHubClient(token="test_token")
+        found = Mock(full_name="Owner/Repo")
+        
+        with patch.object(client, "_search_repositories", return_value=[found]) as search:
+            results = client.bulk_fetch(["owner/repo", "owner/missing"])
+        
+        search.assert_called_once_with({"q": "repo:owner/repo repo:owner/missing fork:true"}, per_page=100)
+        assert results == {"owner/repo": found}
+        assert client.get_repository("https://github.com/owner/repo") is found
+
+    
+    def test_check_file_exists_uses_single_tree_fetch(self):
+        """Test that file checks share one recursive tree request."""
+        client = GitHubClient(token="test_token")
+        repo = Mock(full_name="owner/repo", default_branch="main")
+        repo.get_git_tree.return_value = Mock(
+            raw_data={"truncated": False},
+            tree=[
+                Mock(path="tests", type="tree"),
+                Mock(path="tests/test_app.py", type="blob"),
+                Mock(path="setup.py", type="blob"),
+            ]
+        )
+        
+        assert client.check_any_file_exists(repo, ["test/", "tests/"]) is True
+        assert client.check_file_exists(repo, "setup.py") is True
+        assert client.check_file_exists(repo, "Makefile") is False
+        repo.get_git_tree.assert_called_once_with(sha="main", recursive=True)
+        repo.get_contents.assert_not_called()
+    
+    def test_check_file_exists_falls_back_when_truncated(self):
+        """Test one root listing, then per-path lookups, are used when the tree is truncated."""
+        client = GitHubClient(token="test_token")
+        repo = Mock(full_name="owner/huge", default_branch="main")
+        repo.get_git_tree.return_value = Mock(raw_data={"truncated": True}, tree=[])
+        makefile = Mock(path="Makefile")
+        makefile.name = "Makefile"
+        repo.get_contents.return_value = [makefile]
+        
+        assert client.check_file_exists(repo, "Makefile") is True
+        assert client.check_any_file_exists(repo, ["setup.py", "Cargo.toml"]) is False
+        repo.get_contents.assert_called_once_with("")
+        
+        assert client.check_file_exists(repo, "src/lib.rs") is True
+        repo.get_contents.assert_called_with("src/lib.rs")
+    
+    def test_recursive_trees_of_different_repos_fetch_in_parallel(self):
+        """Test that one repository's tree request does not hold up another's."""
+        client = GitHubClient(token="test_token")
+        both_fetching = threading.Barrier(2, timeout=5)
+        
+        def make_repo(name):
+            repo = Mock(full_name=name, default_branch="main")
+            repo.get_git_tree.side_effect = lambda **kwargs: (
+                both_fetching.wait(), Mock(raw_data={"truncated": False}, tree=[])
+            )[1]
+            return repo
+        
+        repos = [make_repo("owner/one"), make_repo("owner/two")]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            trees = list(executor.map(client.get_recursive_tree, repos + repos))
+        
+        assert trees == [({}, False)] * 4
+        for repo in repos:
+            repo.get_git_tree.assert_called_once_with(sha="main", recursive=True)
+    
+    def test_root_listings_of_different_repos_fetch_in_parallel(self):
+        """Test that one repository's root listing does not hold up another's."""
+        client = GitHubClient(token="test_token")
+        both_fetching = threading.Barrier(2, timeout=5)
+        
+        def make_repo(name):
+            entry = Mock()
+            entry.name = "Makefile"
+            repo = Mock(full_name=name)
+            repo.get_contents.side_effect = lambda path: (both_fetching.wait(), [entry])[1]
+            return repo
+        
+        repos = [make_repo("owner/one"), make_repo("owner/two")]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            listings = list(executor.map(client._get_root_listing, repos + repos))
+        
+        assert listings == [{"Makefile"}] * 4
+        for repo in repos:
+            repo.get_contents.assert_called_once_with("")
 
 
 class TestVerifier:
     """Test repository verifier."""
     
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_client(cls):
+        """Create mock GitHub client once per class (spec introspection isn't free)."""
+        return Mock(spec=GitHubClient)
+    
     @pytest.fixture
-    def mock_client(self):
-        """Create mock GitHub client."""
-        client = Mock(spec=GitHubClient)
-        return client
+    def mock_client(self, shared_client):
+        """Reset the shared mock client for each test."""
+        shared_client.reset_mock(return_value=True, side_effect=True)
+        return shared_client
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_repo(cls):
+        """Create mock repository once per class."""
+        return Mock()
     
     @pytest.fixture
-    def mock_repo(self):
-        """Create mock repository."""
-        repo = Mock()
-        repo.name = "test-repo"
-        repo.full_name = "owner/test-repo"
-        repo.html_url = "https://github.com/owner/test-repo"
-        repo.description = "Test repository"
-        repo.stargazers_count = 100
-        repo.forks_count = 50
-        repo.language = "Python"
-        repo.created_at = datetime.now() - timedelta(days=365)
-        repo.updated_at = datetime.now()
-        repo.license = Mock(name="MIT License")
-        repo.get_topics = Mock(return_value=["testing", "python"])
-        return repo
+    def mock_repo(self, shared_repo):
+        """Reset the shared mock repository to default attributes for each test."""
+        shared_repo.reset_mock(return_value=True, side_effect=True)
+        # Every attribute a test assigns must be reset here
+        shared_repo.configure_mock(
+            name="test-repo",
+            full_name="owner/test-repo",
+            html_url="https://github.com/owner/test-repo",
+            description="Test repository",
+            stargazers_count=100,
+            forks_count=50,
+            fork=False,
+            size=1024,
+            language="Python",
+            created_at=_NOW - timedelta(days=365),
+            updated_at=_NOW,
+            license=Mock(name="MIT License"),
+            topics=["testing", "python"]
+        )
+        return shared_repo
     
     def test_check_primary_language_supported(self, mock_client, mock_repo):
         """Test language check with supported language."""
@@ -123,7 +335,8 @@ class TestVerifier:
         verifier = RepositoryVerifier(mock_client)
         mock_repo.language = "PHP"
         
-        result = verifier._check_primary_language(mock_repo)
+        with patch("verifier.SUPPORTED_LANGUAGES", frozenset({"Python", "Rust", "TypeScript"})):
+            result = verifier._check_primary_language(mock_repo)
         
         assert result.passed is False
     
@@ -154,7 +367,173 @@ class TestVerifier:
         assert result.passed is True
         assert "5" in result.message
     
-    def test_calculate_score(self, mock_client):
+    def test_checks_use_verifier_settings(self, mock_client, mock_repo):
+        """Test that thresholds come from the verifier's settings, not global config."""
+        verifier = RepositoryVerifier(mock_client, Settings(min_contributors=10))
+        mock_client.get_contributors_count.return_value = 5
+        
+        result = verifier._check_multiple_contributors(mock_repo)
+        
+        assert result.passed is False
+        assert "minimum is 10" in result.message
+    
+    def test_quick_fail_skips_expensive_checks(self, mock_client, mock_repo):
+        """Test that hopeless repositories fail without the expensive checks."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_client.has_recent_activity.return_value = False
+        mock_repo.language = None
+        mock_repo.license = None
+        mock_repo.size = 900 * 1024
+        
+        report = verifier.quick_fail(mock_repo)
+        
+        assert report is not None
+        assert report.passed is False
+        assert report.score == verifier._summarize(report.checks)[0]
+        assert len(report.checks) == len(RepositoryVerifier._CHEAP_CHECKS)
+        mock_client.get_contributors_count.assert_not_called()
+    
+    def test_quick_fail_lets_viable_repositories_through(self, mock_client, mock_repo):
+        """Test that a single failed cheap check does not short-circuit."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_client.has_recent_activity.return_value = True
+        mock_repo.license = None
+        mock_repo.size = 1024
+        
+        assert verifier.quick_fail(mock_repo) is None
+    
+
+    def test_readme_fetched_once_per_verification(self, mock_client, mock_repo):
+        """Test that README-based checks share one README request."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_client.get_effective_stars.return_value = 100
+        mock_repo.get_readme.return_value = Mock(decoded_content=b"A small library", size=2000)
+        
+        verifier._check_network_usage(mock_repo)
+        verifier._check_not_vibe_coded(mock_repo)
+        
+        mock_repo.get_readme.assert_called_once()
+    
+    def test_check_complexity_counts_tree_outside_skipped_dirs(self, mock_client, mock_repo):
+        """Test complexity is measured from one tree, ignoring skipped directories."""
+        verifier = RepositoryVerifier(mock_client)
+        entries = {f"src/pkg{d}": "tree" for d in range(8)}
+        entries.update({f"src/pkg{d}/mod{f}.py": "blob" for d in range(8) for f in range(4)})
+        entries.update({"node_modules": "tree", "node_modules/lib/index.js": "blob", "src/builder.py": "blob"})
+        mock_client.get_recursive_tree.return_value = (entries, False)
+        
+        result = verifier._check_complexity(mock_repo)
+        
+        assert result.passed is True
+        assert result.message == "Sufficient complexity (33 files, 8 directories)"
+        mock_repo.get_contents.assert_not_called()
+    
+    def test_vibe_check_stops_probing_after_three_red_flags(self, mock_client, mock_repo):
+        """Test that request-backed probes are skipped once the verdict is decided."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_client.get_effective_stars.return_value = 2
+        mock_repo.description = None
+        mock_repo.created_at = _NOW - timedelta(days=365)
+        mock_repo.get_readme.side_effect = GithubException(404, "Not Found", None)
+        
+        result = verifier._check_not_vibe_coded(mock_repo)
+        
+        assert result.passed is False
+        assert result.message == "Appears vibe-coded: No proper description, Old project with <5 stars, No README"
+        mock_repo.get_releases.assert_not_called()
+        mock_repo.get_commits.assert_not_called()
+    
+    def test_check_network_usage_matches_whole_keywords(self, mock_client, mock_repo):
+        """Test network keywords are matched case-insensitively as whole words."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_repo.get_readme.return_value = Mock(
+            encoding="base64", decoded_content=b"Import it anywhere; supports every platform. Not a Server or HOSTS file."
+        )
+        assert verifier._check_network_usage(mock_repo).passed is True
+        
+        verifier = RepositoryVerifier(mock_client)
+        mock_repo.get_readme.return_value = Mock(
+            encoding="base64", decoded_content=b"Run the Server on a port of your choice, set the HOST and call each API endpoint."
+        )
+        result = verifier._check_network_usage(mock_repo)
+        assert result.passed is False
+        assert "server, port, host, api endpoint" in result.message
+        
+        verifier = RepositoryVerifier(mock_client)
+        mock_repo.get_readme.return_value = Mock(
+            encoding="base64", decoded_content=b"x" * 8192 + b" server port host microservice"
+        )
+        assert verifier._check_network_usage(mock_repo).passed is True
+    
+    def test_check_network_usage_skips_oversized_readme(self, mock_client, mock_repo):
+        """Test that a README GitHub won't inline (encoding "none") skips the scan instead of raising."""
+        from github.ContentFile import ContentFile
+        
+        verifier = RepositoryVerifier(mock_client)
+        mock_repo.get_readme.return_value = ContentFile(
+            requester=Mock(), headers={},
+            attributes={"name": "README.md", "encoding": "none", "content": "", "size": 2_000_000},
+            completed=True
+        )
+        
+        assert verifier._check_network_usage(mock_repo).passed is True
+    
+    def test_rate_limited_check_waits_and_retries(self, mock_client, mock_repo):
+        """Test that an exhausted rate limit is waited out instead of failing the check."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_client.rate_limiter = Mock()
+        mock_client.get_contributors_count.side_effect = [
+            RateLimitExceededException(403, {"message": "API rate limit exceeded"}, {"x-ratelimit-remaining": "0"}),
+            5,
+        ]
+        
+        result = verifier._run_check(mock_repo, "_check_multiple_contributors")
+        
+        assert result.passed is True
+        mock_client.rate_limiter.update.assert_called_once_with({"x-ratelimit-remaining": "0"})
+        mock_client.rate_limiter.wait.assert_called_once()
+    
+    def test_expensive_checks_keep_order_when_run_concurrently(self, mock_client, mock_repo):
+        """Test that concurrently run checks are reported in declaration order."""
+        verifier = RepositoryVerifier(mock_client)
+        mock_client.get_repository.return_value = mock_repo
+        mock_client.get_repo_info.return_value = Mock(stars=100)
+        mock_client.has_recent_activity.return_value = True
+        mock_client.get_contributors_count.return_value = 5
+        mock_client.check_any_file_exists.return_value = True
+        mock_repo.size = 1024
+        mock_repo.get_readme.return_value = Mock(decoded_content=b"A small library", size=2000)
+        mock_client.get_recursive_tree.return_value = ({}, False)
+        
+        report = verifier.verify_repository("owner/test-repo")
+        
+        names = [check.name for check in report.checks]
+        assert names[len(RepositoryVerifier._CHEAP_CHECKS):] == [
+            "Multiple Contributors", "Testing Practices", "Build Instructions",
+            "Code Quality", "Network Usage", "Project Complexity", "Quality Project"
+        ]
+        mock_repo.get_readme.assert_called_once()
+    
+
+    def test_verify_repositories_prefetches_in_bulk(self, mock_client):
+        """Test that bulk verification prefetches once and keeps input order."""
+        verifier = RepositoryVerifier(mock_client)
+        fetched = Mock(spec=Repository, full_name="owner/test-repo")
+        mock_client.parse_full_name.side_effect = GitHubClient.parse_full_name
+        mock_client.bulk_fetch.return_value = {"owner/test-repo": fetched}
+        mock_client.get_repository.side_effect = ValueError("Could not fetch repository")
+        report = Mock()
+        
+        with patch.object(verifier, "_verify", return_value=report) as mock_verify:
+            reports = verifier.verify_repositories([
+                "https://github.com/owner/test-repo", "https://github.com/owner", "owner/missing"
+            ])
+        
+        assert reports == [report, None, None]
+        mock_client.get_repos_bulk.assert_called_once_with(["owner/test-repo", "owner/missing"])
+        mock_verify.assert_called_once_with(fetched)
+    
+    def test_summarize(self, mock_client):
         """Test score calculation."""
         verifier = RepositoryVerifier(mock_client)
         
@@ -165,10 +544,49 @@ class TestVerifier:
             RequirementCheck(name="Test 4", passed=True, message="OK", severity="warning"),
         ]
         
-        score = verifier._calculate_score(checks)
+        score, summary = verifier._summarize(checks)
         
         assert 0 <= score <= 100
         assert score > 0  # Some checks passed
+        assert score == pytest.approx(25 / 35 * 100)
+        assert "Failed 1 critical requirement(s)." in summary
+    
+    def test_score_portfolio(self, mock_client):
+        """Test scoring several repositories' checks in one call."""
+        verifier = RepositoryVerifier(mock_client)
+        passing = [RequirementCheck(name="A", passed=True, message="OK", severity="error")]
+        mixed = [
+            RequirementCheck(name="A", passed=True, message="OK", severity="error"),
+            RequirementCheck(name="B", passed=False, message="Fail", severity="warning"),
+        ]
+        
+        scores = verifier.score_portfolio([passing, mixed, []])
+        
+        assert scores == [100.0, pytest.approx(10 / 15 * 100), 0.0]
+        assert scores[1] == verifier._summarize(mixed)[0]
+    
+    def test_unknown_severity_weighs_like_a_warning(self, mock_client):
+        """Test that a severity missing from the weight table does not break scoring."""
+        verifier = RepositoryVerifier(mock_client)
+        checks = [
+            RequirementCheck(name="A", passed=True, message="OK", severity="error"),
+            RequirementCheck(name="B", passed=False, message="Fail", severity="notice"),
+        ]
+        
+        assert verifier.score_portfolio([checks]) == [pytest.approx(10 / 15 * 100)]
+    
+    def test_summary_uses_configured_pass_threshold(self, mock_client):
+        """Test that the summary agrees with passed when the threshold is not 75."""
+        checks = [
+            RequirementCheck(name="A", passed=True, message="OK", severity="error"),
+            RequirementCheck(name="B", passed=False, message="Fail", severity="warning"),
+        ]
+        
+        strict = RepositoryVerifier(mock_client, Settings(pass_threshold=70))
+        lenient = RepositoryVerifier(mock_client, Settings(pass_threshold=60))
+        
+        assert strict._summarize(checks)[1].endswith("does not meet minimum requirements.")
+        assert lenient._summarize(checks)[1].endswith("Repository meets minimum requirements.")
 
 
 class TestSearchCriteria:
@@ -191,5 +609,546 @@ class TestSearchCriteria:
         assert criteria.has_tests is True
 
 
+class TestSearcher:
+    """Test repository searcher."""
+    
+    def test_search_diverse_codebases_runs_all_categories(self):
+        """Test that every category is searched with its own topics."""
+        searcher = RepositorySearcher(Mock(spec=GitHubClient))
+        
+        def fake_search(criteria, verify):
+            return [(criteria.topics[0], None)]
+        
+        with patch.object(searcher, "search_repositories", side_effect=fake_search):
+            results = searcher.search_diverse_codebases("Python", verify=False)
+        
+        assert results == {
+            "libraries": [("library", None)],
+            "applications": [("application", None)],
+            "sdks": [("sdk", None)],
+            "frameworks": [("framework", None)],
+        }
+    
+    def test_search_stops_fetching_once_enough_results(self):
+        """Test that the searcher consumes search results lazily."""
+        client = Mock(spec=GitHubClient)
+        consumed = []
+        
+        def results():
+            for i in range(1000):
+                consumed.append(i)
+                yield Mock(full_name=f"owner/repo{i}")
+        
+        client.iter_search_repositories.return_value = results()
+        client.get_contributors_count.return_value = 5
+        searcher = RepositorySearcher(client)
+        
+        found = searcher.search_repositories(SearchCriteria(max_results=3), verify=False)
+        
+        assert len(found) == 3
+        assert len(consumed) == 3
+
+
+class TestAsyncGitHubClient:
+    """Test async prefetch client."""
+    
+    def test_prefetch_repository(self):
+        """Test tree paths and Link-header contributor count are prefetched."""
+        import asyncio
+        import httpx
+        from async_github_client import AsyncGitHubClient
+        from rate_limiter import RateLimiter
+        
+        def handler(request):
+            if request.url.path == "/repos/owner/repo/git/trees/abc123":
+                return httpx.Response(200, json={"truncated": False, "tree": [{"path": "tests", "type": "tree"}, {"path": "setup.py", "type": "blob"}]})
+            if request.url.path == "/repos/owner/repo/contributors":
+                link = '<https://api.github.com/repositories/1/contributors?per_page=1&page=42>; rel="last"'
+                return httpx.Response(200, json=[{}], headers={"link": link, "x-ratelimit-remaining": "4321"})
+            return httpx.Response(404)
+        
+        async def run():
+            client = AsyncGitHubClient(token="test_token")
+            client._client = httpx.AsyncClient(base_url="https://api.github.com", transport=httpx.MockTransport(handler))
+            async with client:
+                return await client.prefetch_repository("owner/repo", "abc123")
+        
+        result = asyncio.run(run())
+        
+        assert result == {"tree": {"tests": "tree", "setup.py": "blob"}, "contributors": 42}
+        assert RateLimiter.shared("test_token").remaining == 4321
+
+
+class TestETagCache:
+    """Test conditional-request caching."""
+    
+    def test_not_modified_served_from_cache(self, tmp_path):
+        """Test that a 304 reply returns the cached body with If-None-Match sent."""
+        from github.Requester import Requester
+        from http_cache import ETagCache, GitHubRequester
+        
+        cache = ETagCache(str(tmp_path / "cache.sqlite"))
+        requester = GitHubRequester(
+            cache, auth=None, base_url="https://api.github.com", timeout=15,
+            user_agent="test", per_page=30, verify=True, retry=None, pool_size=None
+        )
+        responses = [
+            (200, {"etag": '"abc"'}, '{"name": "repo"}'),
+            (304, {"etag": '"abc"'}, ""),
+        ]
+        
+        with patch.object(Requester, "requestJson", side_effect=responses) as mock_request:
+            first = requester.requestJson("GET", "/repos/owner/repo")
+            second = requester.requestJson("GET", "/repos/owner/repo")
+        
+        assert first[0] == 200
+        assert second == (200, {"etag": '"abc"'}, '{"name": "repo"}')
+        assert mock_request.call_args_list[1].args[3] == {"If-None-Match": '"abc"'}
+        assert cache.stats == {"miss": 1, "not_modified": 1}
+    
+    def test_fresh_response_served_without_request(self, tmp_path):
+        """Test that responses younger than expire_after skip the network."""
+        from github.Requester import Requester
+        from http_cache import ETagCache, GitHubRequester
+        
+        cache = ETagCache(str(tmp_path / "cache.sqlite"), expire_after=900)
+        requester = GitHubRequester(
+            cache, auth=None, base_url="https://api.github.com", timeout=15,
+            user_agent="test", per_page=30, verify=True, retry=None, pool_size=None
+        )
+        
+        with patch.object(Requester, "requestJson", return_value=(200, {"etag": '"abc"'}, "{}")) as mock_request:
+            requester.requestJson("GET", "/repos/owner/repo")
+            second = requester.requestJson("GET", "/repos/owner/repo")
+        
+        assert second == (200, {"etag": '"abc"'}, "{}")
+        mock_request.assert_called_once()
+    
+    def test_shared_connection_keeps_requests_per_thread(self):
+        """Test that threads sharing the requester's connection do not swap requests."""
+        from http_cache import GitHubRequester, ThreadSafeHTTPSConnection
+        
+        requester = GitHubRequester(
+            None, auth=None, base_url="https://api.github.com", timeout=15,
+            user_agent="test", per_page=30, verify=True, retry=None, pool_size=None
+        )
+        connection = requester._Requester__createConnection()
+        
+        def send(url):
+            connection.request("GET", url, None, {})
+            return connection.url
+        
+        send("/repos/owner/main")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(send, "/repos/owner/other").result()
+        
+        assert isinstance(connection, ThreadSafeHTTPSConnection)
+        assert other == "/repos/owner/other"
+        assert connection.url == "/repos/owner/main"
+
+
+class TestReportCache:
+    """Test persistent verification report cache."""
+    
+    def test_report_round_trip_by_sha(self, tmp_path):
+        """Test reports are reused only for the same commit SHA."""
+        from models import VerificationReport
+        from report_cache import ReportCache
+        
+        repo_info = RepositoryInfo(
+            name="repo", full_name="owner/repo", url="https://github.com/owner/repo",
+            created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 6, 1)
+        )
+        report = VerificationReport(
+            repository=repo_info,
+            checks=[RequirementCheck(name="Open License", passed=True, message="MIT")],
+            score=100.0, passed=True, summary="Excellent"
+        )
+        cache = ReportCache(str(tmp_path / "reports.sqlite"))
+        
+        cache.set("owner/repo", "abc123", report)
+        
+        assert cache.get("owner/repo", "abc123") == report
+        assert cache.get("owner/repo", "def456") is None
+
+
+class TestRateLimiter:
+    """Test primary rate limit gating."""
+    
+    def test_waits_for_reset_below_low_water_mark(self):
+        """Test that the limiter sleeps until reset once the budget runs low."""
+        from rate_limiter import RateLimiter
+        
+        limiter = RateLimiter(low_water_mark=50)
+        limiter.update({"x-ratelimit-remaining": "10", "x-ratelimit-reset": "1030"})
+        
+        with patch("rate_limiter.time.time", return_value=1000), \
+             patch("rate_limiter.time.sleep") as mock_sleep:
+            limiter.wait()
+            limiter.wait()
+        
+        mock_sleep.assert_called_once_with(30)
+    
+    def test_ignores_search_budget(self):
+        """Test that the separate search budget does not gate core requests."""
+        from rate_limiter import RateLimiter
+        
+        limiter = RateLimiter(low_water_mark=50)
+        limiter.update({"x-ratelimit-remaining": "2", "x-ratelimit-reset": "1030", "x-ratelimit-resource": "search"})
+        
+        assert limiter.remaining is None
+    
+    def test_token_pool_skips_exhausted_tokens(self):
+        """Test that the pool rotates tokens and skips ones below the low-water mark."""
+        from rate_limiter import RateLimiter, TokenPool
+        
+        pool = TokenPool(["pool_a", "pool_b", "pool_c"])
+        RateLimiter.shared("pool_b").update({"x-ratelimit-remaining": "1", "x-ratelimit-reset": str(time.time() + 60)})
+        try:
+            tokens = [pool.next_token() for _ in range(4)]
+        finally:
+            for token in pool.tokens:
+                RateLimiter._instances.pop(token, None)
+        
+        assert tokens == ["pool_a", "pool_c", "pool_a", "pool_c"]
+
+
+class TestApprovedRepos:
+    """Test approved repositories batch verification."""
+    
+    def test_verify_all_isolates_errors(self, capsys):
+        """Test that one failing repository does not stop the batch."""
+        import approved_repos
+        
+        def fake_verify(repo):
+            if repo.endswith("broken"):
+                raise ValueError("boom")
+            return Mock(passed=True, score=90.0)
+        
+        urls = ["https://github.com/a/one", "https://github.com/a/broken", "https://github.com/a/two"]
+        with patch.object(approved_repos, "APPROVED_REPOS", urls), \
+             patch.object(approved_repos, "GitHubClient") as client_cls, \
+             patch.object(approved_repos, "REPORT_CACHE_PATH", ""), \
+             patch.object(approved_repos, "prefetch_repositories", new=Mock()), \
+             patch.object(approved_repos.asyncio, "run", return_value={}), \
+             patch.object(approved_repos, "RepositoryVerifier") as verifier_cls:
+            client_cls.return_value.bulk_fetch.return_value = {}
+            verifier_cls.return_value.verify_repository.side_effect = fake_verify
+            approved_repos.verify_all(workers=2)
+        
+        output = capsys.readouterr().out
+        assert "Passed: 2/3" in output
+        assert "broken: score 0" in output
+    
+    def test_verify_all_reports_malformed_urls(self, capsys):
+        """Test that an unparseable entry is reported without aborting the run."""
+        import approved_repos
+        
+        urls = ["https://github.com/a/one", "https://github.com/owner"]
+        with patch.object(approved_repos, "APPROVED_REPOS", urls), \
+             patch.object(approved_repos, "GitHubClient") as client_cls, \
+             patch.object(approved_repos, "REPORT_CACHE_PATH", ""), \
+             patch.object(approved_repos, "prefetch_repositories", new=Mock()), \
+             patch.object(approved_repos.asyncio, "run", return_value={}), \
+             patch.object(approved_repos, "RepositoryVerifier") as verifier_cls:
+            client = client_cls.return_value
+            client.parse_full_name.side_effect = GitHubClient.parse_full_name
+            client.bulk_fetch.return_value = {}
+            verifier_cls.return_value.verify_repository.return_value = Mock(passed=True, score=90.0)
+            approved_repos.verify_all(workers=2)
+        
+        output = capsys.readouterr().out
+        assert "Passed: 1/2" in output
+        assert "Invalid GitHub URL" in output
+        client.get_repos_bulk.assert_called_once_with(["a/one"])
+        client.bulk_fetch.assert_called_once_with(["a/one"])
+
+
+
+class TestWebApp:
+    """Test web interface helpers."""
+    
+    def test_cached_verify_reuses_report_per_settings(self):
+        """Test that repeated verifications hit the cache until settings change."""
+        import web_app
+        
+        web_app._report_cache.clear()
+        verifier = Mock(settings=web_app._build_settings({}))
+        lenient = Mock(settings=web_app._build_settings({"passThreshold": "50"}))
+        
+        first = web_app.cached_verify(verifier, "https://github.com/Owner/Repo")
+        second = web_app.cached_verify(verifier, "owner/repo")
+        web_app.cached_verify(lenient, "owner/repo")
+        web_app._report_cache.clear()
+        
+        assert first is second
+        assert verifier.verify_repository.call_count == 1
+        assert lenient.verify_repository.call_count == 1
+        assert lenient.settings.pass_threshold == 50
+    
+    def test_cached_verify_joins_inflight_verification(self):
+        """Test that concurrent verifications of one repository share a single run."""
+        import threading
+        import web_app
+        
+        web_app._report_cache.clear()
+        started, release = threading.Event(), threading.Event()
+        
+        def slow_verify(repo_url):
+            started.set()
+            release.wait(5)
+            return Mock(name="report")
+        
+        verifier = Mock(settings=web_app._build_settings({}))
+        verifier.verify_repository.side_effect = slow_verify
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(web_app.cached_verify, verifier, "owner/repo")
+            started.wait(5)
+            follower = executor.submit(web_app.cached_verify, verifier, "https://github.com/owner/repo")
+            time.sleep(0.05)  # let the follower reach the in-flight Future
+            release.set()
+            reports = leader.result(), follower.result()
+        web_app._report_cache.clear()
+        
+        assert reports[0] is reports[1]
+        assert verifier.verify_repository.call_count == 1
+        assert not web_app._inflight
+    
+    def test_serialize_checks_splits_by_outcome(self):
+        """Test that checks are serialized and bucketed in one pass."""
+        import web_app
+        
+        checks = [
+            RequirementCheck("A", True, "ok"),
+            RequirementCheck("B", False, "bad"),
+            RequirementCheck("C", False, "meh", severity="warning"),
+            RequirementCheck("D", False, "fyi", severity="info"),
+        ]
+        serialized, failed, warnings, passed = web_app.serialize_checks(checks)
+        
+        assert [c["name"] for c in serialized] == ["A", "B", "C", "D"]
+        assert serialized[2] == {"name": "C", "passed": False, "message": "meh", "severity": "warning"}
+        assert failed == [{"name": "B", "message": "bad"}]
+        assert warnings == [{"name": "C", "message": "meh"}]
+        assert passed == [{"name": "A", "message": "ok"}]
+    
+    def test_invalid_repo_url_rejected_before_api_calls(self):
+        """Test that malformed repository URLs get a 400 without creating a client."""
+        import web_app
+        
+        with patch.object(web_app, "get_client") as get_client:
+            response = web_app.app.test_client().post("/api/verify", json={"repo_url": "https://gitlab.com/a/b"})
+            single = web_app.app.test_client().post("/api/verify-single", json={"repo_url": "not a repo"})
+        
+        assert response.status_code == 400
+        assert single.status_code == 400
+        assert single.get_json()["passed"] is False
+        get_client.assert_not_called()
+    
+    def test_search_prefilters_candidates_by_forks(self):
+        """Test that candidates with too few forks skip the contributor count request."""
+        import web_app
+        
+        client = Mock()
+        client.iter_search_repositories.return_value = iter([Mock(forks_count=0), Mock(forks_count=4)])
+        client.get_contributors_count.return_value = 5
+        with patch.object(web_app, "get_client", return_value=client):
+            response = web_app.app.test_client().post("/api/search", json={"min_contributors": 5})
+            lines = response.get_data().splitlines()
+        
+        assert len(lines) == 1
+        client.get_contributors_count.assert_called_once()
+    
+    def test_search_caps_scanned_candidates(self):
+        """Test that strict filters stop the scan at max_results * SEARCH_CANDIDATES_PER_RESULT."""
+        import web_app
+        
+        pulled = []
+        
+        def hits():
+            for _ in range(1000):
+                pulled.append(1)
+                yield Mock(forks_count=0)
+        
+        client = Mock()
+        client.iter_search_repositories.return_value = hits()
+        with patch.object(web_app, "get_client", return_value=client):
+            response = web_app.app.test_client().post("/api/search", json={"min_contributors": 5, "max_results": 2})
+            lines = response.get_data().splitlines()
+        
+        assert lines == []
+        assert len(pulled) == 2 * web_app.SEARCH_CANDIDATES_PER_RESULT
+    
+    @pytest.mark.parametrize("body", [
+        {"max_results": 21},
+        {"max_results": "10"},
+        {"topics": ["t"] * 9},
+        {"topics": ["x" * 65]},
+        {"repo_age_months": 0},
+        {"min_stars": -1},
+        {"settings": {"passThreshold": 101}},
+        {"settings": [75]},
+    ])
+    def test_search_rejects_out_of_range_input(self, body):
+        """Test that /api/search bounds its inputs before any API calls."""
+        import web_app
+        
+        with patch.object(web_app, "get_client") as get_client:
+            response = web_app.app.test_client().post("/api/search", json=body)
+        
+        assert response.status_code == 400
+        get_client.assert_not_called()
+    
+    @pytest.mark.parametrize("path,body", [
+        ("/api/verify", {"repo_url": "owner/repo"}),
+        ("/api/verify-single", {"repo_url": "owner/repo"}),
+        ("/api/verify-bulk", {"repo_urls": ["owner/repo"]}),
+    ])
+    @pytest.mark.parametrize("settings", [
+        {"minStars": "many"},
+        {"minContributors": -1},
+        {"passThreshold": 150},
+        "strict",
+    ])
+    def test_verify_rejects_invalid_settings(self, path, body, settings):
+        """Test that malformed or out-of-range settings are a 400, not a 500."""
+        import web_app
+        
+        with patch.object(web_app, "get_client") as get_client:
+            response = web_app.app.test_client().post(path, json={**body, "settings": settings})
+        
+        assert response.status_code == 400
+        assert "settings" in response.get_json()["error"]
+        get_client.assert_not_called()
+    
+    def test_verify_bulk_isolates_errors(self):
+        """Test that the bulk endpoint verifies every URL and reports failures per item."""
+        import web_app
+        
+        web_app._report_cache.clear()
+        report = Mock(score=90.0, passed=True, checks=[RequirementCheck("A", True, "ok")])
+        report.repository = Mock(full_name="a/one", stars=10, language="Python")
+        
+        def fake_verify(repo_url):
+            if repo_url == "a/broken":
+                raise ValueError("boom")
+            return report
+        
+        client = Mock(prefetched={})
+        client.bulk_fetch.return_value = {"a/one": Mock(full_name="a/one", default_branch="main")}
+        prefetch = AsyncMock(return_value={"a/one": {"contributors": 5}})
+        with patch.object(web_app, "get_client", return_value=client), \
+             patch.object(web_app, "prefetch_repositories", prefetch), \
+             patch.object(web_app.RepositoryVerifier, "verify_repository", side_effect=fake_verify):
+            response = web_app.app.test_client().post("/api/verify-bulk", json={
+                "repo_urls": ["https://github.com/a/one", "a/broken", "not a url"]
+            })
+        web_app._report_cache.clear()
+        
+        results = response.get_json()["results"]
+        assert [r["url"] for r in results] == ["https://github.com/a/one", "a/broken", "not a url"]
+        assert results[0]["passed"] is True and results[0]["passed_count"] == 1
+        assert results[1]["error"] == "boom"
+        assert "Invalid" in results[2]["error"]
+        client.bulk_fetch.assert_called_once_with(["a/one", "a/broken"])
+        prefetch.assert_awaited_once_with({"a/one": "main"}, client.token)
+        assert client.prefetched == {"a/one": {"contributors": 5}}
+    
+    def test_search_age_cutoff_is_memoized_per_minute(self):
+        """Test that the created:>= cutoff is reused within a minute bucket."""
+        import web_app
+        
+        web_app._cutoff.cache_clear()
+        first = web_app._cutoff(6, 100)
+        second = web_app._cutoff(6, 100)
+        
+        assert first == second
+        assert web_app._cutoff.cache_info().hits == 1
+        assert datetime.strptime(first, "%Y-%m-%d")
+    
+    def test_approved_list_is_cacheable(self):
+        """Test that /api/approved sends cache headers and answers 304 to a matching ETag."""
+        import web_app
+        
+        client = web_app.app.test_client()
+        first = client.get("/api/approved")
+        second = client.get("/api/approved", headers={"If-None-Match": first.headers["ETag"]})
+        
+        assert first.headers["Cache-Control"] in ("public, max-age=300", "max-age=300, public")
+        assert second.status_code == 304
+        assert second.get_data() == b""
+    
+    def test_unexpected_errors_return_request_id(self):
+        """Test that unhandled errors answer with an ID instead of a traceback."""
+        import web_app
+        
+        with patch.object(web_app, "get_client", side_effect=RuntimeError("boom")):
+            response = web_app.app.test_client().post("/api/verify", json={"repo_url": "owner/repo"})
+        
+        body = response.get_json()
+        assert response.status_code == 500
+        assert body["error"] == "boom"
+        assert len(body["request_id"]) == 32
+        assert "traceback" not in body
+    
+    def test_http_errors_return_json(self):
+        """Test that HTTP errors (e.g. a non-JSON body) answer as JSON too."""
+        import web_app
+        
+        response = web_app.app.test_client().post("/api/verify", data="owner/repo", content_type="text/plain")
+        
+        body = response.get_json()
+        assert response.status_code == 415
+        assert "Content-Type" in body["error"]
+        assert len(body["request_id"]) == 32
+    
+    def test_json_responses_use_orjson_provider(self):
+        """Test that jsonify output is produced by the orjson provider."""
+        import web_app
+        
+        assert isinstance(web_app.app.json, web_app.OrjsonProvider)
+        with patch.object(web_app, "APPROVED_REPOS", ["https://github.com/a/one"]):
+            response = web_app.app.test_client().get("/api/approved")
+        
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"repos": ["https://github.com/a/one"], "count": 1}
+    
+    def test_iter_concurrently_stops_pulling_items_at_limit(self):
+        """Test that candidates are pulled lazily and only qualifying results yielded."""
+        import web_app
+        
+        pulled = []
+        
+        def items():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+        
+        results = list(web_app._iter_concurrently(
+            lambda i: {"n": i} if i % 2 == 0 else None, items(), limit=3, max_workers=2
+        ))
+        
+        assert len(results) == 3
+        assert all(r["n"] % 2 == 0 for r in results)
+        assert len(pulled) < 20
+    
+    def test_search_streams_ndjson(self):
+        """Test that /api/search streams one JSON line per qualifying repository."""
+        import web_app
+        
+        client = Mock()
+        client.iter_search_repositories.return_value = iter([Mock(forks_count=10) for _ in range(3)])
+        client.get_contributors_count.side_effect = [5, 1, 5]
+        client.get_repo_info.side_effect = lambda repo: Mock(
+            full_name="a/b", url="https://github.com/a/b", language="Python", stars=10, license="MIT"
+        )
+        with patch.object(web_app, "get_client", return_value=client):
+            response = web_app.app.test_client().post("/api/search", json={"min_contributors": 3})
+            lines = response.get_data().splitlines()
+        
+        assert response.mimetype == "application/x-ndjson"
+        assert len(lines) == 2
+        assert orjson.loads(lines[0])["name"] == "a/b"
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""Shared helpers."""
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# owner/repo from a GitHub URL; ignores ".git", trailing paths, queries and fragments
+GITHUB_URL_RE = re.compile(r"github\.com/([^/?#]+)/([^/?#]+?)(?:\.git)?(?=[/?#]|$)")
+
+
+def parse_github_url(url: str) -> Optional[tuple[str, str]]:
+    """Extract (owner, repo) from a GitHub URL, or None if it doesn't match."""
+    match = GITHUB_URL_RE.search(url)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+# Strict repository reference checked before any API request: a github.com
+# URL (trailing paths, queries and fragments allowed) or bare "owner/repo",
+# using only the characters GitHub allows in owner and repository names
+REPO_REF_RE = re.compile(
+    r"^(?:(?:https?://)?(?:www\.)?github\.com/)?"
+    r"([A-Za-z0-9](?:[A-Za-z0-9-]{0,38}))/([\w.-]{1,100}?)(?:\.git)?"
+    r"(?:[/?#].*)?$"
+)
+
+
+def parse_repo_url(value: str) -> Optional[tuple[str, str]]:
+    """Validate a repository URL or owner/repo, returning (owner, repo) or None."""
+    match = REPO_REF_RE.match(value.strip())
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+class TTLCache:
+    """Thread-safe in-memory mapping whose entries expire ttl seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize cache holding at most maxsize entries for ttl seconds each."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value for a key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entries beyond maxsize."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
@@ -1,68 +1,152 @@
 """Repository verification module."""
 import re
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Union
+from github import GithubException, RateLimitExceededException
+from github.ContentFile import ContentFile
 from github.Repository import Repository
 
 from github_client import GitHubClient
-from models import RequirementCheck, VerificationReport, RepositoryInfo
+from models import RequirementCheck, VerificationReport, RepositoryInfo, Settings
 from config import (
     SUPPORTED_LANGUAGES,
-    MIN_STARS,
-    MIN_CONTRIBUTORS,
-    ACTIVITY_DAYS,
-    TESTING_FILES,
-    BUILD_FILES,
-    LINTER_FILES,
+    TESTING_PATHS,
+    BUILD_PATHS,
+    LINTER_PATHS,
     NETWORK_INDICATORS,
-    MIN_FILES,
-    MIN_DIRECTORIES,
-    MAX_SIZE_MB
+    SKIP_DIRS
 )
 
+# Leading README bytes scanned for network keywords
+_README_SCAN_BYTES = 8192
+
+# README keywords suggesting a networked service, matched as whole words
+# (optionally plural) so e.g. "import" or "support" don't count as "port"
+_NETWORK_KEYWORDS = ("server", "port", "host", "api endpoint", "microservice")
+_NETWORK_RE = re.compile(r"\b(" + "|".join(_NETWORK_KEYWORDS) + r")s?\b", re.IGNORECASE)
+
+# Matches paths inside (or equal to) a skipped directory at any depth
+_SKIP_DIR_RE = re.compile(r"(?:^|/)(?:" + "|".join(map(re.escape, SKIP_DIRS)) + r")(?:/|$)")
+
 
 class RepositoryVerifier:
     """Verify repository against quality requirements."""
 
-    def __init__(self, client: GitHubClient):
-        """Initialize verifier with GitHub client."""
+    # Checks that only read repository metadata (no extra API requests)
+    _CHEAP_CHECKS = (
+        "_check_is_git_repo",
+        "_check_primary_language",
+        "_check_open_license",
+        "_check_recent_activity",
+        "_check_size",
+    )
+
+    # Checks that issue further API requests; they are independent and I/O
+    # bound, so they run concurrently
+    _EXPENSIVE_CHECKS = (
+        "_check_multiple_contributors",
+        "_check_has_testing",
+        "_check_build_instructions",
+        "_check_code_quality_indicators",
+        "_check_network_usage",
+        "_check_complexity",
+        "_check_not_vibe_coded",
+    )
+
+    # Score weight per check severity (errors count twice as much as the rest)
+    _SEVERITY_WEIGHT = {"error": 10, "warning": 5, "info": 5}
+
+    # Red flags after which a repository counts as vibe-coded
+    _VIBE_CODED_RED_FLAGS = 3
+
+    def __init__(self, client: GitHubClient, settings: Optional[Settings] = None):
+        """Initialize verifier with GitHub client and thresholds (config defaults if omitted)."""
         self.client = client
+        self.settings = settings or Settings()
+        # Data shared by several checks, memoized per repository full name
+        # for the duration of one verification (values are Futures so
+        # concurrent checks wait for a single fetch)
+        self._cache: dict[str, dict[str, Future]] = {}
+        self._cache_lock = threading.Lock()
 
-    def verify_repository(self, repo_url: str) -> VerificationReport:
+    def verify_repository(self, repo_url: Union[str, Repository]) -> VerificationReport:
         """
         Verify a repository against all requirements.
         
         Args:
-            repo_url: GitHub repository URL or owner/repo format
+            repo_url: GitHub repository URL, owner/repo format, or an
+                already-fetched Repository object (skips the fetch)
             
         Returns:
             VerificationReport with all checks and score
         """
-        repo = self.client.get_repository(repo_url)
+        if isinstance(repo_url, Repository):
+            repo = repo_url
+        else:
+            repo = self.client.get_repository(repo_url)
+        
+        try:
+            return self._verify(repo)
+        finally:
+            self._cache.pop(repo.full_name, None)
+
+    def verify_repositories(self, repo_urls: list[str]) -> list[Optional[VerificationReport]]:
+        """
+        Verify many repositories, fetching what they share in bulk first.
+        
+        Metadata and top-level listings come from batched GraphQL queries
+        and Repository objects from batched search queries, so each
+        verification only issues the requests its remaining checks need.
+        
+        Args:
+            repo_urls: GitHub repository URLs or owner/repo names
+            
+        Returns:
+            Reports in input order; None for repositories that could not be fetched
+        """
+        full_names = []
+        for repo_url in repo_urls:
+            try:
+                full_names.append(self.client.parse_full_name(repo_url))
+            except ValueError:
+                full_names.append(None)
+        
+        valid_names = [name for name in full_names if name is not None]
+        self.client.get_repos_bulk(valid_names)
+        repos = self.client.bulk_fetch(valid_names)
+        
+        reports = []
+        for full_name in full_names:
+            if full_name is None:
+                reports.append(None)
+                continue
+            try:
+                reports.append(self.verify_repository(repos.get(full_name, full_name)))
+            except ValueError:
+                reports.append(None)
+        return reports
+
+    def _verify(self, repo: Repository) -> VerificationReport:
+        """Run all checks against a fetched repository."""
+        # Pin the reference time for every time-based check in this run
+        self._get_now(repo)
         repo_info = self.client.get_repo_info(repo)
+        # RepositoryInfo already holds the evaluation stars (parent's for forks)
+        self._memoized(repo, "stars", lambda: repo_info.stars)
         
-        checks = [
-            self._check_is_git_repo(repo),
-            self._check_primary_language(repo),
-            self._check_open_license(repo),
-            self._check_multiple_contributors(repo),
-            self._check_recent_activity(repo),
-            self._check_has_testing(repo),
-            self._check_build_instructions(repo),
-            self._check_code_quality_indicators(repo),
-            self._check_network_usage(repo),
-            self._check_complexity(repo),
-            self._check_not_vibe_coded(repo),
-            self._check_size(repo),
-        ]
-
-        # Calculate score
-        score = self._calculate_score(checks)
-        
-        # Import PASS_THRESHOLD from config
-        from config import PASS_THRESHOLD
-        passed = score >= PASS_THRESHOLD
-        
-        summary = self._generate_summary(checks, score)
+        # Cheap checks first: if they already rule out passing, skip the rest
+        checks = self._run_checks(repo, self._CHEAP_CHECKS)
+        quick_report = self._quick_fail_report(repo_info, checks)
+        if quick_report is not None:
+            return quick_report
+        
+        checks += self._run_checks_concurrently(repo, self._EXPENSIVE_CHECKS)
+
+        # Calculate score and summary in one pass over the checks
+        score, summary = self._summarize(checks)
+        passed = score >= self.settings.pass_threshold
 
         return VerificationReport(
             repository=repo_info,
@@ -72,6 +156,102 @@ class RepositoryVerifier:
             summary=summary
         )
 
+    def quick_fail(self, repo: Repository) -> Optional[VerificationReport]:
+        """
+        Run only the checks that need no extra API requests.
+        
+        Returns:
+            A failing VerificationReport if the repository cannot reach the
+            pass threshold whatever the remaining checks return, else None
+        """
+        checks = self._run_checks(repo, self._CHEAP_CHECKS)
+        return self._quick_fail_report(self.client.get_repo_info(repo), checks)
+
+    def _memoized(self, repo: Repository, key: str, fetch: Callable[[], Any]) -> Any:
+        """Compute a value once per verification, even when checks ask for it concurrently."""
+        with self._cache_lock:
+            cache = self._cache.setdefault(repo.full_name, {})
+            future = cache.get(key)
+            owner = future is None
+            if owner:
+                future = cache[key] = Future()
+        
+        if owner:
+            try:
+                future.set_result(fetch())
+            except BaseException as e:
+                future.set_exception(e)
+                # Let a retry (e.g. after a rate limit wait) fetch again
+                with self._cache_lock:
+                    self._cache.get(repo.full_name, {}).pop(key, None)
+        return future.result()
+
+    def _get_now(self, repo: Repository) -> datetime:
+        """Get the current UTC time, fixed for the duration of one verification."""
+        return self._memoized(repo, "now", lambda: datetime.now(timezone.utc))
+
+    def _get_readme(self, repo: Repository) -> Optional[ContentFile]:
+        """Get the README once per verification (None if it can't be fetched)."""
+        def fetch():
+            try:
+                return repo.get_readme()
+            except RateLimitExceededException:
+                raise
+            except GithubException:
+                return None
+        return self._memoized(repo, "readme", fetch)
+
+    def _get_effective_stars(self, repo: Repository) -> int:
+        """Get stars used for evaluation (the parent's for forks), once per verification."""
+        return self._memoized(repo, "stars", lambda: self.client.get_effective_stars(repo))
+
+    def _run_checks(self, repo: Repository, names: tuple[str, ...]) -> list[RequirementCheck]:
+        """Run the named check methods in order."""
+        return [self._run_check(repo, name) for name in names]
+
+    def _run_checks_concurrently(self, repo: Repository, names: tuple[str, ...]) -> list[RequirementCheck]:
+        """Run the named check methods in parallel threads, returning results in order."""
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            return list(executor.map(lambda name: self._run_check(repo, name), names))
+
+    def _run_check(self, repo: Repository, name: str) -> RequirementCheck:
+        """Run one check, waiting out an exhausted rate limit once and retrying."""
+        try:
+            return getattr(self, name)(repo)
+        except RateLimitExceededException as e:
+            # Checks don't swallow rate limit errors, so a result is never
+            # degraded to "could not verify" just because the budget ran out
+            self.client.rate_limiter.update(e.headers or {})
+            self.client.rate_limiter.wait()
+            return getattr(self, name)(repo)
+
+    def _quick_fail_report(
+        self,
+        repo_info: RepositoryInfo,
+        checks: list[RequirementCheck]
+    ) -> Optional[VerificationReport]:
+        """Build a failing report if the best achievable score is below the threshold."""
+        # Assume every remaining check passes with the highest weight,
+        # so a quick fail never rejects a repository the full run would pass
+        remaining_weight = self._SEVERITY_WEIGHT["error"] * len(self._EXPENSIVE_CHECKS)
+        earned_weight, total_weight, _, _ = self._tally(checks)
+        best_score = (earned_weight + remaining_weight) / (total_weight + remaining_weight) * 100
+        
+        if best_score >= self.settings.pass_threshold:
+            return None
+        
+        # Report what the checks that ran actually scored, not the bound
+        score, summary = self._summarize(checks)
+        summary += f" Skipped {len(self._EXPENSIVE_CHECKS)} remaining check(s): pass threshold is unreachable."
+        
+        return VerificationReport(
+            repository=repo_info,
+            checks=checks,
+            score=score,
+            passed=False,
+            summary=summary
+        )
+
     def _check_is_git_repo(self, repo: Repository) -> RequirementCheck:
         """Check if it's a valid git repository."""
         # If we can fetch it, it's a git repo
@@ -94,6 +274,14 @@ class RepositoryVerifier:
                 severity="error"
             )
         
+        if SUPPORTED_LANGUAGES is not None and language not in SUPPORTED_LANGUAGES:
+            return RequirementCheck(
+                name="Primary Language",
+                passed=False,
+                message=f"{language} is not a supported language",
+                severity="error"
+            )
+        
         return RequirementCheck(
             name="Primary Language",
             passed=True,
@@ -124,7 +312,7 @@ class RepositoryVerifier:
         """Check if repository has multiple contributors."""
         contributors_count = self.client.get_contributors_count(repo)
         
-        if contributors_count >= MIN_CONTRIBUTORS:
+        if contributors_count >= self.settings.min_contributors:
             return RequirementCheck(
                 name="Multiple Contributors",
                 passed=True,
@@ -135,32 +323,32 @@ class RepositoryVerifier:
             return RequirementCheck(
                 name="Multiple Contributors",
                 passed=False,
-                message=f"Only {contributors_count} contributor(s), minimum is {MIN_CONTRIBUTORS}",
+                message=f"Only {contributors_count} contributor(s), minimum is {self.settings.min_contributors}",
                 severity="error"
             )
 
     def _check_recent_activity(self, repo: Repository) -> RequirementCheck:
         """Check for recent activity in repository."""
-        has_activity = self.client.has_recent_activity(repo, ACTIVITY_DAYS)
+        has_activity = self.client.has_recent_activity(repo, self.settings.activity_days)
         
         if has_activity:
             return RequirementCheck(
                 name="Recent Activity",
                 passed=True,
-                message=f"Active in last {ACTIVITY_DAYS} days",
+                message=f"Active in last {self.settings.activity_days} days",
                 severity="warning"
             )
         else:
             return RequirementCheck(
                 name="Recent Activity",
                 passed=False,
-                message=f"No activity in last {ACTIVITY_DAYS} days",
+                message=f"No activity in last {self.settings.activity_days} days",
                 severity="warning"
             )
 
     def _check_has_testing(self, repo: Repository) -> RequirementCheck:
         """Check if repository has testing practices."""
-        has_tests = self.client.check_any_file_exists(repo, TESTING_FILES)
+        has_tests = self.client.check_any_file_exists(repo, TESTING_PATHS)
         
         if has_tests:
             return RequirementCheck(
@@ -179,7 +367,7 @@ class RepositoryVerifier:
 
     def _check_build_instructions(self, repo: Repository) -> RequirementCheck:
         """Check if repository has build/setup instructions."""
-        has_build_files = self.client.check_any_file_exists(repo, BUILD_FILES)
+        has_build_files = self.client.check_any_file_exists(repo, BUILD_PATHS)
         
         if has_build_files:
             return RequirementCheck(
@@ -198,18 +386,9 @@ class RepositoryVerifier:
 
     def _check_code_quality_indicators(self, repo: Repository) -> RequirementCheck:
         """Check for code quality tools (linters, formatters)."""
-        has_quality_tools = self.client.check_any_file_exists(repo, LINTER_FILES)
-        
-        stars = repo.stargazers_count
+        has_quality_tools = self.client.check_any_file_exists(repo, LINTER_PATHS)
         
-        # If it's a fork, always use parent's stars for evaluation
-        if repo.fork:
-            try:
-                parent = repo.parent
-                if parent:
-                    stars = parent.stargazers_count
-            except:
-                pass
+        stars = self._get_effective_stars(repo)
         
         if has_quality_tools:
             return RequirementCheck(
@@ -237,11 +416,18 @@ class RepositoryVerifier:
         """Check if repository makes extensive network/port usage."""
         # This is a heuristic check - look for common server patterns
         try:
-            readme = repo.get_readme()
-            readme_content = readme.decoded_content.decode('utf-8').lower() if readme.decoded_content else ""
+            readme = self._get_readme(repo)
+            # READMEs over 1 MB come back with encoding "none" and no content
+            # (decoded_content would raise); they're skipped like missing ones
+            readme_bytes = b""
+            if readme is not None and readme.encoding == "base64":
+                # Keywords show up early if at all; only scan the start
+                readme_bytes = (readme.decoded_content or b"")[:_README_SCAN_BYTES]
+            readme_content = readme_bytes.decode('utf-8', errors='ignore')
             
-            network_keywords = ['server', 'port', 'host', 'api endpoint', 'microservice']
-            found_keywords = [kw for kw in network_keywords if readme_content and kw in readme_content]
+            # One case-insensitive pass instead of lowercasing and scanning once per keyword
+            matched = {m.lower() for m in _NETWORK_RE.findall(readme_content)}
+            found_keywords = [kw for kw in _NETWORK_KEYWORDS if kw in matched]
             
             if len(found_keywords) >= 3:
                 return RequirementCheck(
@@ -250,8 +436,8 @@ class RepositoryVerifier:
                     message=f"May require extensive network access (keywords: {', '.join(found_keywords)})",
                     severity="warning"
                 )
-        except Exception:
-            pass  # If README can't be fetched, skip this check
+        except AttributeError:
+            pass  # Unexpected README payload: skip this check
         
         return RequirementCheck(
             name="Network Usage",
@@ -262,61 +448,43 @@ class RepositoryVerifier:
 
     def _check_complexity(self, repo: Repository) -> RequirementCheck:
         """Check if repository has sufficient complexity."""
-        try:
-            # Get repository contents to count files and directories
-            contents = repo.get_contents("")
-            files_count = 0
-            dirs_count = 0
-            
-            items_to_check = list(contents) if isinstance(contents, list) else [contents]
-            checked_items = set()
-            
-            while items_to_check and files_count < 150:  # Limit to avoid too many API calls
-                item = items_to_check.pop(0)
-                
-                # Avoid checking same path twice
-                if item.path in checked_items:
-                    continue
-                checked_items.add(item.path)
-                
-                # Skip common non-code directories
-                skip_dirs = ['.git', '.github', 'node_modules', '__pycache__', '.pytest_cache', 
-                            'dist', 'build', '.venv', 'venv', 'htmlcov']
-                if any(skip in item.path for skip in skip_dirs):
-                    continue
-                
-                if item.type == "dir":
-                    dirs_count += 1
-                    try:
-                        sub_contents = repo.get_contents(item.path)
-                        sub_items = list(sub_contents) if isinstance(sub_contents, list) else [sub_contents]
-                        items_to_check.extend(sub_items)
-                    except:
-                        pass
-                else:
-                    files_count += 1
-            
-            # Check if meets minimum complexity
-            if files_count >= MIN_FILES and dirs_count >= MIN_DIRECTORIES:
-                return RequirementCheck(
-                    name="Project Complexity",
-                    passed=True,
-                    message=f"Sufficient complexity ({files_count} files, {dirs_count} directories)",
-                    severity="error"
-                )
-            else:
-                return RequirementCheck(
-                    name="Project Complexity",
-                    passed=False,
-                    message=f"Too simple: {files_count} files, {dirs_count} dirs (need {MIN_FILES}+ files, {MIN_DIRECTORIES}+ dirs)",
-                    severity="error"
-                )
-        except Exception as e:
+        tree = self.client.get_recursive_tree(repo)
+        if tree is None:
             # If we can't check complexity, fail to be safe
             return RequirementCheck(
                 name="Project Complexity",
                 passed=False,
-                message=f"Could not verify complexity: {str(e)}",
+                message="Could not verify complexity: repository tree unavailable",
+                severity="error"
+            )
+        
+        # Count files and directories outside common non-code directories
+        # (a truncated tree gives lower bounds, which is enough to pass)
+        entries, _ = tree
+        files_count = 0
+        dirs_count = 0
+        for path, entry_type in entries.items():
+            if _SKIP_DIR_RE.search(path):
+                continue
+            if entry_type == "blob":
+                files_count += 1
+            elif entry_type == "tree":
+                dirs_count += 1
+        
+        # Check if meets minimum complexity
+        min_files, min_dirs = self.settings.min_files, self.settings.min_directories
+        if files_count >= min_files and dirs_count >= min_dirs:
+            return RequirementCheck(
+                name="Project Complexity",
+                passed=True,
+                message=f"Sufficient complexity ({files_count} files, {dirs_count} directories)",
+                severity="error"
+            )
+        else:
+            return RequirementCheck(
+                name="Project Complexity",
+                passed=False,
+                message=f"Too simple: {files_count} files, {dirs_count} dirs (need {min_files}+ files, {min_dirs}+ dirs)",
                 severity="error"
             )
 
@@ -326,57 +494,28 @@ class RepositoryVerifier:
         
         try:
             # Get stars (use parent's if fork)
-            stars = repo.stargazers_count
-            if repo.fork:
-                try:
-                    parent = repo.parent
-                    if parent:
-                        stars = parent.stargazers_count
-                except:
-                    pass
-            
-            # Check 1: Very recent creation with all commits in short timespan
-            age_days = (datetime.now(timezone.utc) - repo.created_at).days
-            if age_days < 30:
-                # Check commit distribution
-                try:
-                    commits = list(repo.get_commits()[:20])
-                    if len(commits) >= 10:
-                        first_commit_date = commits[-1].commit.author.date
-                        last_commit_date = commits[0].commit.author.date
-                        commit_span_days = (last_commit_date - first_commit_date).days
-                        
-                        if commit_span_days < 7:
-                            red_flags.append("All commits in < 7 days")
-                except:
-                    pass
-            
-            # Check 2: No description
-            if not repo.description or len(repo.description.strip()) < 20:
-                red_flags.append("No proper description")
-            
-            # Check 3: No releases/tags
-            try:
-                releases = repo.get_releases().totalCount
-                if releases == 0 and stars < 100:
-                    red_flags.append("No releases")
-            except:
-                pass
-            
-            # Check 4: README too short
-            try:
-                readme = repo.get_readme()
-                if readme.size < 500:  # Less than 500 bytes
-                    red_flags.append("Minimal README")
-            except:
-                red_flags.append("No README")
+            stars = self._get_effective_stars(repo)
+            age_days = (self._get_now(repo) - repo.created_at).days
             
-            # Check 5: Very few stars for project age
-            if age_days > 90 and stars < 5:
-                red_flags.append("Old project with <5 stars")
+            # Probes ordered by cost: repository metadata first, then the
+            # README shared with other checks, then one request each. Stop
+            # as soon as the verdict can no longer change.
+            probes = (
+                lambda: self._vibe_description_flag(repo),
+                lambda: "Old project with <5 stars" if age_days > 90 and stars < 5 else None,
+                lambda: self._vibe_readme_flag(repo),
+                lambda: self._vibe_releases_flag(repo) if stars < 100 else None,
+                lambda: self._vibe_commit_span_flag(repo) if age_days < 30 else None,
+            )
+            for probe in probes:
+                flag = probe()
+                if flag:
+                    red_flags.append(flag)
+                    if len(red_flags) >= self._VIBE_CODED_RED_FLAGS:
+                        break
             
             # Decision
-            if len(red_flags) >= 3:
+            if len(red_flags) >= self._VIBE_CODED_RED_FLAGS:
                 return RequirementCheck(
                     name="Quality Project",
                     passed=False,
@@ -397,7 +536,9 @@ class RepositoryVerifier:
                     message="Appears well-maintained",
                     severity="warning"
                 )
-        except Exception as e:
+        except RateLimitExceededException:
+            raise
+        except (GithubException, AttributeError):
             return RequirementCheck(
                 name="Quality Project",
                 passed=True,
@@ -405,13 +546,56 @@ class RepositoryVerifier:
                 severity="warning"
             )
 
+    def _vibe_description_flag(self, repo: Repository) -> Optional[str]:
+        """Flag a missing or very short description."""
+        if not repo.description or len(repo.description.strip()) < 20:
+            return "No proper description"
+        return None
+
+    def _vibe_readme_flag(self, repo: Repository) -> Optional[str]:
+        """Flag a missing or minimal README."""
+        readme = self._get_readme(repo)
+        if readme is None:
+            return "No README"
+        if readme.size < 500:  # Less than 500 bytes
+            return "Minimal README"
+        return None
+
+    def _vibe_releases_flag(self, repo: Repository) -> Optional[str]:
+        """Flag a repository without releases."""
+        try:
+            if repo.get_releases().totalCount == 0:
+                return "No releases"
+        except RateLimitExceededException:
+            raise
+        except GithubException:
+            pass
+        return None
+
+    def _vibe_commit_span_flag(self, repo: Repository) -> Optional[str]:
+        """Flag a new repository whose recent commits all landed within a week."""
+        try:
+            commits = list(repo.get_commits()[:20])
+            if len(commits) >= 10:
+                first_commit_date = commits[-1].commit.author.date
+                last_commit_date = commits[0].commit.author.date
+                commit_span_days = (last_commit_date - first_commit_date).days
+                
+                if commit_span_days < 7:
+                    return "All commits in < 7 days"
+        except RateLimitExceededException:
+            raise
+        except (GithubException, AttributeError):
+            pass
+        return None
+
     def _check_size(self, repo: Repository) -> RequirementCheck:
         """Check if repository size is reasonable."""
         try:
             size_kb = repo.size  # GitHub API returns size in KB
             size_mb = size_kb / 1024
             
-            if size_mb <= MAX_SIZE_MB:
+            if size_mb <= self.settings.max_size_mb:
                 return RequirementCheck(
                     name="Repository Size",
                     passed=True,
@@ -422,10 +606,11 @@ class RepositoryVerifier:
                 return RequirementCheck(
                     name="Repository Size",
                     passed=False,
-                    message=f"Too large: {size_mb:.1f} MB (max {MAX_SIZE_MB} MB)",
+                    message=f"Too large: {size_mb:.1f} MB (max {self.settings.max_size_mb} MB)",
                     severity="error"
                 )
-        except Exception as e:
+        except (AttributeError, TypeError):
+            # Size missing from the payload
             return RequirementCheck(
                 name="Repository Size",
                 passed=True,
@@ -433,28 +618,50 @@ class RepositoryVerifier:
                 severity="warning"
             )
 
-    def _calculate_score(self, checks: list[RequirementCheck]) -> float:
-        """Calculate overall score from checks."""
-        if not checks:
-            return 0.0
-        
-        # Weight errors more than warnings
+    def _tally(self, checks: list[RequirementCheck]) -> tuple[int, int, int, int]:
+        """Get (earned weight, total weight, failed errors, failed warnings) in one pass."""
         total_weight = 0
         earned_weight = 0
+        failed_errors = 0
+        failed_warnings = 0
         
         for check in checks:
-            weight = 10 if check.severity == "error" else 5
+            weight = self._SEVERITY_WEIGHT.get(check.severity, 5)
             total_weight += weight
             if check.passed:
                 earned_weight += weight
+            elif check.severity == "error":
+                failed_errors += 1
+            elif check.severity == "warning":
+                failed_warnings += 1
         
-        return (earned_weight / total_weight) * 100 if total_weight > 0 else 0
+        return earned_weight, total_weight, failed_errors, failed_warnings
 
-    def _generate_summary(self, checks: list[RequirementCheck], score: float) -> str:
-        """Generate a text summary of the verification."""
-        failed_errors = [c for c in checks if not c.passed and c.severity == "error"]
-        failed_warnings = [c for c in checks if not c.passed and c.severity == "warning"]
+    def _summarize(self, checks: list[RequirementCheck]) -> tuple[float, str]:
+        """Calculate overall score and text summary from checks."""
+        earned_weight, total_weight, failed_errors, failed_warnings = self._tally(checks)
+        score = (earned_weight / total_weight) * 100 if total_weight > 0 else 0.0
+        return score, self._format_summary(score, failed_errors, failed_warnings)
+
+    def score_portfolio(self, all_checks: list[list[RequirementCheck]]) -> list[float]:
+        """
+        Score several repositories' check results at once (e.g. to re-score
+        cached reports after a weight change).
         
+        Args:
+            all_checks: One list of checks per repository
+            
+        Returns:
+            Scores (0-100) in the same order
+        """
+        scores = []
+        for checks in all_checks:
+            earned_weight, total_weight, _, _ = self._tally(checks)
+            scores.append((earned_weight / total_weight) * 100 if total_weight > 0 else 0.0)
+        return scores
+
+    def _format_summary(self, score: float, failed_errors: int, failed_warnings: int) -> str:
+        """Generate a text summary of the verification."""
         if score >= 90:
             quality = "Excellent"
         elif score >= 70:
@@ -467,11 +674,11 @@ class RepositoryVerifier:
         summary = f"{quality} quality (Score: {score:.1f}/100). "
         
         if failed_errors:
-            summary += f"Failed {len(failed_errors)} critical requirement(s). "
+            summary += f"Failed {failed_errors} critical requirement(s). "
         if failed_warnings:
-            summary += f"{len(failed_warnings)} warning(s). "
+            summary += f"{failed_warnings} warning(s). "
         
-        if score >= 75:
+        if score >= self.settings.pass_threshold:
             summary += "Repository meets minimum requirements."
         else:
             summary += "Repository does not meet minimum requirements."
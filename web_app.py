@@ -1,29 +1,363 @@
 #!/usr/bin/env python3
 """Web interface for GitHub Repository Checker."""
-from flask import Flask, render_template, request, jsonify
+import asyncio
+import hashlib
+import itertools
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional, Union
+import orjson
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from werkzeug.exceptions import HTTPException
+from flask.json.provider import DefaultJSONProvider
+from github.Repository import Repository
+from approved_repos import APPROVED_REPOS
+from async_github_client import prefetch_repositories
 from github_client import GitHubClient
+from http_cache import ETagCache
+from models import RequirementCheck, Settings, VerificationReport
+from rate_limiter import TokenPool
+from utils import TTLCache, parse_repo_url
 from verifier import RepositoryVerifier
-import traceback
 import config
 
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (jsonify and request.get_json)."""
+
+    def _options(self, pretty: bool) -> int:
+        """orjson options: non-string dict keys allowed, indented when pretty."""
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize to a JSON string."""
+        return orjson.dumps(obj, default=self.default, option=self._options(bool(kwargs.get("indent")))).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response from orjson's bytes without a str round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(pretty) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Search candidates processed (contributor filter + verification) concurrently
+SEARCH_WORKERS = 8
+
+# Candidates with fewer forks than min_contributors minus this are dropped
+# without fetching their contributor count (search results carry forks_count)
+PREFILTER_FORK_SLACK = 2
+# Outcomes of the contributor prefilter ("skipped" saved an API call,
+# "rejected" means the real count still failed), for tuning the slack
+_prefilter_stats = Counter()
+_prefilter_lock = threading.Lock()
+
+# Repositories accepted by one /api/verify-bulk request, and how many are
+# verified at once
+BULK_MAX_URLS = 50
+BULK_WORKERS = 8
+
+# The approved list is fixed for the life of the process, so browsers may
+# reuse it for a while and revalidate it with its ETag afterwards
+APPROVED_MAX_AGE = 300  # seconds
+_APPROVED_ETAG = hashlib.md5(orjson.dumps(APPROVED_REPOS)).hexdigest()
+
+# Search input bounds (each result can cost several API calls)
+SEARCH_MAX_RESULTS = 20
+# Candidates scanned per requested result at most (each costs a contributors
+# request, plus a full verification when verify is set); the old *3 overfetch
+SEARCH_CANDIDATES_PER_RESULT = 3
+SEARCH_MAX_TOPICS = 8
+SEARCH_MAX_TOPIC_LENGTH = 64
+SEARCH_MAX_AGE_MONTHS = 120
+
+# Process-wide clients (one per token) whose connection pools (and GraphQL
+# sessions) every request reuses; created on first use so importing the app
+# doesn't require a token
+_base_clients: dict[str, GitHubClient] = {}
+_base_clients_lock = threading.Lock()
+_token_pool = TokenPool(config.GITHUB_TOKENS) if config.GITHUB_TOKENS else None
+
+
+def get_client() -> GitHubClient:
+    """
+    Get a client for one request: the next token from the pool, with fresh
+    per-run caches over that token's shared connections.
+
+    A single long-lived GitHubClient would keep its repository/tree/contributor
+    memos forever (unbounded and never refreshed), so only the transport is shared.
+    """
+    if _token_pool is None:
+        raise ValueError("GitHub token is required. Set GITHUB_TOKEN or GITHUB_TOKENS in .env file")
+    token = _token_pool.next_token()
+    with _base_clients_lock:
+        if token not in _base_clients:
+            _base_clients[token] = GitHubClient(token)
+        return GitHubClient.sharing(_base_clients[token])
+
+
+# Verification reports reused across requests for the same repository and settings
+REPORT_CACHE_SIZE = 4096
+REPORT_CACHE_TTL = 300  # seconds
+_report_cache = TTLCache(maxsize=REPORT_CACHE_SIZE, ttl=REPORT_CACHE_TTL)
+
+# Verifications currently running, keyed like _report_cache; concurrent
+# requests for the same repository wait on the first one's Future
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def cached_verify(verifier: RepositoryVerifier, repo_url: Union[str, Repository]) -> VerificationReport:
+    """
+    Verify a repository (URL or object), reusing a recent report made under
+    the same settings or joining a verification of it that is already running.
+    """
+    full_name = repo_url.full_name if isinstance(repo_url, Repository) else GitHubClient.parse_full_name(repo_url)
+    key = (full_name.lower(), verifier.settings)
+    report = _report_cache.get(key)
+    if report is not None:
+        return report
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        report = verifier.verify_repository(repo_url)
+        _report_cache.set(key, report)
+        future.set_result(report)
+        return report
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def serialize_checks(checks: Iterable[RequirementCheck]) -> tuple[list[dict], list[dict], list[dict], list[dict]]:
+    """
+    Serialize checks in one pass into (all, failed errors, failed warnings,
+    passed errors); the last three hold only name and message.
+    """
+    serialized, failed, warnings, passed = [], [], [], []
+    for check in checks:
+        serialized.append({
+            'name': check.name,
+            'passed': check.passed,
+            'message': check.message,
+            'severity': check.severity
+        })
+        if check.severity == 'error':
+            (passed if check.passed else failed).append({'name': check.name, 'message': check.message})
+        elif check.severity == 'warning' and not check.passed:
+            warnings.append({'name': check.name, 'message': check.message})
+    return serialized, failed, warnings, passed
+
+
+def _batch_item(verifier: Optional[RepositoryVerifier], repo_url: str) -> dict:
+    """
+    Verify one repository for the batch views; invalid URLs and verification
+    errors are reported in the item's 'error' instead of being raised.
+    """
+    parsed = parse_repo_url(repo_url)
+    if parsed is None:
+        return {
+            'url': repo_url,
+            'name': repo_url,
+            'error': f'Invalid GitHub repository URL: {repo_url}',
+            'passed': False,
+            'score': 0
+        }
+    
+    try:
+        report = cached_verify(verifier, '/'.join(parsed))
+    except Exception as e:
+        return {
+            'url': repo_url,
+            'name': parsed[1],
+            'error': str(e),
+            'passed': False,
+            'score': 0
+        }
+    
+    _, failed_checks, warnings, passed_checks = serialize_checks(report.checks)
+    return {
+        'url': repo_url,
+        'name': report.repository.full_name,
+        'score': report.score,
+        'passed': report.passed,
+        'stars': report.repository.stars,
+        'language': report.repository.language,
+        'failed_count': len(failed_checks),
+        'warning_count': len(warnings),
+        'passed_count': len(passed_checks),
+        'failed_checks': failed_checks,
+        'warnings': warnings,
+        'passed_checks': passed_checks
+    }
+
+
+def _iter_concurrently(
+    process: Callable[..., Optional[dict]],
+    items: Iterable,
+    limit: int,
+    max_workers: int = SEARCH_WORKERS
+) -> Iterator[dict]:
+    """
+    Run process over items in a thread pool, yielding up to limit non-None results.
+    
+    Items are pulled lazily (only max_workers are in flight), so a paginated
+    search is never fetched further than needed. Results come in completion
+    order; closing the generator early cancels whatever hasn't started.
+    """
+    items = iter(items)
+    produced = 0
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {executor.submit(process, item) for item in itertools.islice(items, max_workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result is None:
+                    continue
+                yield result
+                produced += 1
+                if produced >= limit:
+                    return
+            pending |= {executor.submit(process, item) for item in itertools.islice(items, len(done))}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Frontend setting names mapped to Settings fields
+_SETTINGS_KEYS = {
+    'minStars': 'min_stars',
+    'minContributors': 'min_contributors',
+    'minFiles': 'min_files',
+    'minDirectories': 'min_directories',
+    'maxSizeMB': 'max_size_mb',
+    'activityDays': 'activity_days',
+    'passThreshold': 'pass_threshold',
+}
+
+
+# Upper bounds for per-request settings (pass_threshold is a 0-100 score)
+_SETTINGS_MAX = {'passThreshold': 100}
+
+
+def _validate_settings(settings) -> Optional[str]:
+    """Check frontend settings types and bounds; returns an error message or None."""
+    if settings is None:
+        return None
+    if not isinstance(settings, dict):
+        return 'settings must be a JSON object'
+    for key in _SETTINGS_KEYS:
+        if key not in settings:
+            continue
+        value = settings[key]
+        if not _is_int(value) or value < 0:
+            return f'settings.{key} must be a non-negative integer'
+        if key in _SETTINGS_MAX and value > _SETTINGS_MAX[key]:
+            return f'settings.{key} must be at most {_SETTINGS_MAX[key]}'
+    return None
+
+
+def _build_settings(settings: Optional[dict]) -> Settings:
+    """Build per-request Settings from frontend settings (config defaults for the rest)."""
+    settings = settings or {}
+    return Settings(**{
+        field: int(settings[key]) for key, field in _SETTINGS_KEYS.items() if key in settings
+    })
+
+
+def _minute_bucket() -> int:
+    """Current minute since the epoch (cache key for _cutoff)."""
+    return int(time.time() // 60)
+
 
-def apply_settings(settings):
-    """Apply settings from frontend to config."""
-    if 'minStars' in settings:
-        config.MIN_STARS = int(settings['minStars'])
-    if 'minContributors' in settings:
-        config.MIN_CONTRIBUTORS = int(settings['minContributors'])
-    if 'minFiles' in settings:
-        config.MIN_FILES = int(settings['minFiles'])
-    if 'minDirectories' in settings:
-        config.MIN_DIRECTORIES = int(settings['minDirectories'])
-    if 'maxSizeMB' in settings:
-        config.MAX_SIZE_MB = int(settings['maxSizeMB'])
-    if 'activityDays' in settings:
-        config.ACTIVITY_DAYS = int(settings['activityDays'])
-    if 'passThreshold' in settings:
-        config.PASS_THRESHOLD = int(settings['passThreshold'])
+@lru_cache(maxsize=16)
+def _cutoff(months: int, bucket: int) -> str:
+    """Creation-date cutoff (YYYY-MM-DD) for a repository age, computed once per minute."""
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=months * 30)
+    return cutoff_date.strftime('%Y-%m-%d')
+
+
+def _is_int(value) -> bool:
+    """Whether a JSON value is an integer (booleans excluded)."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _validate_search(data) -> Optional[str]:
+    """Check /api/search input against the bounds above; returns an error message or None."""
+    if not isinstance(data, dict):
+        return 'Request body must be a JSON object'
+    
+    topics = data.get('topics') or []
+    if not isinstance(topics, list) or not all(isinstance(t, str) for t in topics):
+        return 'topics must be a list of strings'
+    if len(topics) > SEARCH_MAX_TOPICS:
+        return f'At most {SEARCH_MAX_TOPICS} topics are allowed'
+    if any(len(t) > SEARCH_MAX_TOPIC_LENGTH for t in topics):
+        return f'Topics must be at most {SEARCH_MAX_TOPIC_LENGTH} characters'
+    
+    language = data.get('language')
+    if language is not None and (not isinstance(language, str) or len(language) > SEARCH_MAX_TOPIC_LENGTH):
+        return 'language must be a short string'
+    
+    max_results = data.get('max_results', 10)
+    if not _is_int(max_results) or not 1 <= max_results <= SEARCH_MAX_RESULTS:
+        return f'max_results must be between 1 and {SEARCH_MAX_RESULTS}'
+    
+    for name in ('min_stars', 'min_contributors'):
+        value = data.get(name, 0)
+        if not _is_int(value) or value < 0:
+            return f'{name} must be a non-negative integer'
+    
+    repo_age_months = data.get('repo_age_months')
+    if repo_age_months is not None and (
+        not _is_int(repo_age_months) or not 1 <= repo_age_months <= SEARCH_MAX_AGE_MONTHS
+    ):
+        return f'repo_age_months must be between 1 and {SEARCH_MAX_AGE_MONTHS}'
+    
+    return _validate_settings(data.get('settings'))
+
+def _log_error(e: Exception) -> str:
+    """Log an unexpected error with its traceback under a new ID (returned for the response)."""
+    error_id = uuid.uuid4().hex
+    app.logger.error("[%s] %s", error_id, e, exc_info=e)
+    return error_id
+
+
+@app.errorhandler(Exception)
+def handle_error(e: Exception):
+    """Return errors as JSON with an ID to find them in the log (with the traceback if unexpected)."""
+    if isinstance(e, HTTPException):
+        error_id = uuid.uuid4().hex
+        app.logger.warning("[%s] %s", error_id, e)
+        return jsonify({'error': e.description, 'request_id': error_id}), e.code
+    return jsonify({'error': str(e), 'request_id': _log_error(e)}), 500
 
 @app.route('/')
 def index():
@@ -33,241 +367,226 @@ def index():
 @app.route('/api/verify', methods=['POST'])
 def verify_repo():
     """Verify a repository."""
-    try:
-        data = request.get_json()
-        repo_url = data.get('repo_url', '').strip()
-        settings = data.get('settings', {})
-        
-        if not repo_url:
-            return jsonify({'error': 'Repository URL is required'}), 400
-        
-        # Apply settings if provided
-        if settings:
-            apply_settings(settings)
-        
-        client = GitHubClient()
-        verifier = RepositoryVerifier(client)
-        
-        report = verifier.verify_repository(repo_url)
-        
-        # Convert to dict
-        failed_checks = report.get_failed_checks()
-        warnings = report.get_warnings()
-        passed_checks = [c for c in report.checks if c.passed and c.severity == 'error']
-        
-        result = {
-            'repository': {
-                'name': report.repository.full_name,
-                'url': report.repository.url,
-                'language': report.repository.language,
-                'stars': report.repository.stars,
-                'license': report.repository.license,
-                'description': report.repository.description,
-            },
-            'score': report.score,
-            'passed': report.passed,
-            'summary': report.summary,
-            'checks': [
-                {
-                    'name': check.name,
-                    'passed': check.passed,
-                    'message': check.message,
-                    'severity': check.severity
-                }
-                for check in report.checks
-            ],
-            'failed_checks': [
-                {
-                    'name': check.name,
-                    'message': check.message
-                }
-                for check in failed_checks
-            ],
-            'warnings': [
-                {
-                    'name': check.name,
-                    'message': check.message
-                }
-                for check in warnings
-            ],
-            'passed_checks': [
-                {
-                    'name': check.name,
-                    'message': check.message
-                }
-                for check in passed_checks
-            ]
-        }
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 500
+    data = request.get_json()
+    repo_url = data.get('repo_url', '').strip()
+    
+    if not repo_url:
+        return jsonify({'error': 'Repository URL is required'}), 400
+    parsed = parse_repo_url(repo_url)
+    if parsed is None:
+        return jsonify({'error': f'Invalid GitHub repository URL: {repo_url}'}), 400
+    error = _validate_settings(data.get('settings'))
+    if error:
+        return jsonify({'error': error}), 400
+    settings = _build_settings(data.get('settings'))
+    
+    client = get_client()
+    verifier = RepositoryVerifier(client, settings)
+    
+    report = cached_verify(verifier, '/'.join(parsed))
+    
+    # Convert to dict
+    checks, failed_checks, warnings, passed_checks = serialize_checks(report.checks)
+    
+    result = {
+        'repository': {
+            'name': report.repository.full_name,
+            'url': report.repository.url,
+            'language': report.repository.language,
+            'stars': report.repository.stars,
+            'license': report.repository.license,
+            'description': report.repository.description,
+        },
+        'score': report.score,
+        'passed': report.passed,
+        'summary': report.summary,
+        'checks': checks,
+        'failed_checks': failed_checks,
+        'warnings': warnings,
+        'passed_checks': passed_checks
+    }
+    
+    return jsonify(result)
 
 @app.route('/api/approved', methods=['GET'])
 def get_approved_repos():
-    """Get list of approved repositories."""
-    try:
-        from approved_repos import APPROVED_REPOS
-        return jsonify({
+    """Get list of approved repositories (cacheable; 304 when the ETag matches)."""
+    if _APPROVED_ETAG in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = jsonify({
             'repos': APPROVED_REPOS,
             'count': len(APPROVED_REPOS)
         })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    response.set_etag(_APPROVED_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = APPROVED_MAX_AGE
+    return response
 
 @app.route('/api/verify-single', methods=['POST'])
 def verify_single_from_batch():
     """Verify a single repository (for batch processing)."""
-    try:
-        data = request.get_json()
-        repo_url = data.get('repo_url', '').strip()
-        settings = data.get('settings', {})
-        
-        if not repo_url:
-            return jsonify({'error': 'Repository URL is required'}), 400
-        
-        # Apply settings if provided
-        if settings:
-            apply_settings(settings)
-        
-        client = GitHubClient()
-        verifier = RepositoryVerifier(client)
-        
-        try:
-            report = verifier.verify_repository(repo_url)
-            failed_checks = report.get_failed_checks()
-            warnings = report.get_warnings()
-            passed_checks = [c for c in report.checks if c.passed and c.severity == 'error']
-            
-            result = {
-                'url': repo_url,
-                'name': report.repository.full_name,
-                'score': report.score,
-                'passed': report.passed,
-                'stars': report.repository.stars,
-                'language': report.repository.language,
-                'failed_count': len(failed_checks),
-                'warning_count': len(warnings),
-                'passed_count': len(passed_checks),
-                'failed_checks': [{'name': c.name, 'message': c.message} for c in failed_checks],
-                'warnings': [{'name': c.name, 'message': c.message} for c in warnings],
-                'passed_checks': [{'name': c.name, 'message': c.message} for c in passed_checks]
-            }
-        except Exception as e:
-            result = {
-                'url': repo_url,
-                'name': repo_url.split('/')[-1],
-                'error': str(e),
-                'passed': False,
-                'score': 0
-            }
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    repo_url = data.get('repo_url', '').strip()
+    
+    if not repo_url:
+        return jsonify({'error': 'Repository URL is required'}), 400
+    if parse_repo_url(repo_url) is None:
+        return jsonify(_batch_item(None, repo_url)), 400
+    error = _validate_settings(data.get('settings'))
+    if error:
+        return jsonify({'error': error}), 400
+    settings = _build_settings(data.get('settings'))
+    
+    client = get_client()
+    verifier = RepositoryVerifier(client, settings)
+    
+    return jsonify(_batch_item(verifier, repo_url))
+
+@app.route('/api/verify-bulk', methods=['POST'])
+def verify_bulk():
+    """Verify many repositories in one request (for batch processing)."""
+    data = request.get_json(silent=True)
+    repo_urls = data.get('repo_urls') if isinstance(data, dict) else None
+    
+    if not isinstance(repo_urls, list) or not repo_urls or not all(isinstance(u, str) for u in repo_urls):
+        return jsonify({'error': 'repo_urls must be a non-empty list of repository URLs'}), 400
+    if len(repo_urls) > BULK_MAX_URLS:
+        return jsonify({'error': f'At most {BULK_MAX_URLS} repositories per request'}), 400
+    error = _validate_settings(data.get('settings'))
+    if error:
+        return jsonify({'error': error}), 400
+    repo_urls = [url.strip() for url in repo_urls]
+    
+    client = get_client()
+    verifier = RepositoryVerifier(client, _build_settings(data.get('settings')))
+    
+    # Hydrate every valid repository with batched search queries up front
+    full_names = ['/'.join(parsed) for parsed in map(parse_repo_url, repo_urls) if parsed]
+    repos = client.bulk_fetch(full_names) if full_names else {}
+    
+    # Overlap the tree and contributor requests of the ones not cached yet on
+    # one event loop (httpx over HTTP/2), as verify_all does for the approved
+    # list; the default branch comes from the search results
+    refs = {
+        repo.full_name: repo.default_branch
+        for name, repo in repos.items()
+        if _report_cache.get((name.lower(), verifier.settings)) is None
+    }
+    if refs:
+        for full_name, prefetched in asyncio.run(prefetch_repositories(refs, client.token)).items():
+            client.prefetched.setdefault(full_name, {}).update(prefetched)
+    
+    with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+        results = list(executor.map(lambda url: _batch_item(verifier, url), repo_urls))
+    
+    return jsonify({'results': results})
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Get cache hit counts for tuning (HTTP ETag cache and search prefilter)."""
+    http_cache = ETagCache.shared(config.HTTP_CACHE_PATH, config.HTTP_CACHE_TTL) if config.HTTP_CACHE_PATH else None
+    with _prefilter_lock:
+        prefilter = dict(_prefilter_stats)
+    return jsonify({
+        'http_cache': dict(http_cache.stats) if http_cache else None,
+        'prefilter': prefilter
+    })
 
 @app.route('/api/search', methods=['POST'])
 def search_repos():
     """Search repositories."""
-    try:
-        data = request.get_json()
-        settings = data.get('settings', {})
-        
-        # Apply settings if provided
-        if settings:
-            apply_settings(settings)
-        
-        client = GitHubClient()
-        verifier = RepositoryVerifier(client)
-        
-        # Build search query
-        query_parts = []
-        topics = data.get('topics', [])
-        language = data.get('language')
-        min_stars = data.get('min_stars', 3)
-        min_contributors = data.get('min_contributors', 3)
-        max_results = min(data.get('max_results', 10), 20)
-        verify = data.get('verify', False)
-        repo_age_months = data.get('repo_age_months')
-        
-        # Add keywords to search in name, description, readme
-        if topics:
-            # Search for keywords in general (not just topics)
-            keywords = ' '.join(topics)
-            query_parts.append(keywords)
-        
-        # Add age filter if specified
-        if repo_age_months:
-            from datetime import datetime, timedelta, timezone
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=repo_age_months * 30)
-            date_str = cutoff_date.strftime('%Y-%m-%d')
-            query_parts.append(f'created:>={date_str}')
-        
-        query = ' '.join(query_parts) if query_parts else 'stars:>0'
-        
-        # Search repositories
-        repos = client.search_repositories(
-            query=query,
-            language=language,
-            min_stars=min_stars,
-            max_results=max_results * 3  # Get more to filter
-        )
-        
-        results = []
-        for repo in repos:
-            # Filter by contributors
-            contributors_count = client.get_contributors_count(repo)
-            if contributors_count < min_contributors:
-                continue
-            
-            repo_info = client.get_repo_info(repo)
-            
-            if verify:
-                try:
-                    report = verifier.verify_repository(repo.html_url)
-                    if report.passed:
-                        results.append({
-                            'name': repo_info.full_name,
-                            'url': repo_info.url,
-                            'language': repo_info.language,
-                            'stars': repo_info.stars,
-                            'license': repo_info.license,
-                            'score': report.score
-                        })
-                except Exception as e:
-                    # Skip repositories that fail verification
-                    continue
-            else:
-                results.append({
-                    'name': repo_info.full_name,
-                    'url': repo_info.url,
-                    'language': repo_info.language,
-                    'stars': repo_info.stars,
-                    'license': repo_info.license,
-                    'score': None
-                })
-            
-            if len(results) >= max_results:
-                break
-        
-        # Sort by stars if not verified
-        if not verify:
-            results.sort(key=lambda x: x['stars'] or 0, reverse=True)
+    data = request.get_json(silent=True)
+    error = _validate_search(data)
+    if error:
+        return jsonify({'error': error}), 400
+    
+    settings = _build_settings(data.get('settings'))
+    
+    client = get_client()
+    verifier = RepositoryVerifier(client, settings)
+    
+    # Build search query
+    query_parts = []
+    topics = data.get('topics') or []
+    language = data.get('language')
+    min_stars = data.get('min_stars', 3)
+    min_contributors = data.get('min_contributors', 3)
+    max_results = data.get('max_results', 10)
+    verify = data.get('verify', False)
+    repo_age_months = data.get('repo_age_months')
+    
+    # Add keywords to search in name, description, readme
+    if topics:
+        # Search for keywords in general (not just topics)
+        keywords = ' '.join(topics)
+        query_parts.append(keywords)
+    
+    # Add age filter if specified
+    if repo_age_months:
+        query_parts.append(f'created:>={_cutoff(repo_age_months, _minute_bucket())}')
+    
+    query = ' '.join(query_parts) if query_parts else 'stars:>0'
+    
+    # Search repositories; pages are fetched only as the loop needs them
+    repos = client.iter_search_repositories(
+        query=query,
+        language=language,
+        min_stars=min_stars,
+        per_page=max_results * 3
+    )
+    
+    def process_repo(repo):
+        """Filter and (optionally) verify one candidate; None if it doesn't qualify."""
+        # Filter by contributors: cheap forks heuristic first, then the real count
+        if repo.forks_count < min_contributors - PREFILTER_FORK_SLACK:
+            outcome = 'skipped'
+        elif client.get_contributors_count(repo) < min_contributors:
+            outcome = 'rejected'
         else:
-            results.sort(key=lambda x: x['score'] or 0, reverse=True)
+            outcome = 'accepted'
+        with _prefilter_lock:
+            _prefilter_stats[outcome] += 1
+        if outcome != 'accepted':
+            return None
         
-        return jsonify({'results': results})
+        repo_info = client.get_repo_info(repo)
+        score = None
         
-    except Exception as e:
-        return jsonify({
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 500
+        if verify:
+            try:
+                report = cached_verify(verifier, repo)
+            except Exception:
+                # Skip repositories that fail verification
+                return None
+            if not report.passed:
+                return None
+            score = report.score
+        
+        return {
+            'name': repo_info.full_name,
+            'url': repo_info.url,
+            'language': repo_info.language,
+            'stars': repo_info.stars,
+            'license': repo_info.license,
+            'score': score
+        }
+    
+    # Candidates are handled concurrently with one shared client and each
+    # match is streamed as an NDJSON line as soon as it qualifies (the
+    # page sorts them); disconnecting stops the remaining work
+    candidates = itertools.islice(repos, max_results * SEARCH_CANDIDATES_PER_RESULT)
+    
+    def generate():
+        try:
+            for result in _iter_concurrently(process_repo, candidates, max_results):
+                yield orjson.dumps(result) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so errors become the stream's last line
+            yield orjson.dumps({'error': str(e), 'request_id': _log_error(e)}) + b"\n"
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only; use gunicorn wsgi:app in production
+    app.run(host='0.0.0.0', port=5000, threaded=True)